@@ -27,17 +27,27 @@ modules = [
     ("justiceai.core.metrics.calculator", "Metrics Calculator"),
 ]
 
+# Duplicate entries would cause redundant writes
+if len({module_path for module_path, _ in modules}) != len(modules):
+    raise ValueError("Duplicate module in API reference list")
+
+
+def _render(module_path: str, title: str) -> str:
+    """Render the markdown page for a module."""
+    return (
+        f"# {title}\n\n"
+        f"::: {module_path}\n"
+        "    options:\n"
+        "      show_source: true\n"
+        "      heading_level: 2\n"
+    )
+
+
 for module_path, title in modules:
     # Create markdown file for each module
     doc_path = Path("api", f"{module_path.replace('.', '/')}.md")
-
     with mkdocs_gen_files.open(doc_path, "w") as f:
-        # Write module documentation header
-        f.write(f"# {title}\n\n")
-        f.write(f"::: {module_path}\n")
-        f.write("    options:\n")
-        f.write("      show_source: true\n")
-        f.write("      heading_level: 2\n")
+        f.write(_render(module_path, title))
 
     # Add to navigation
     parts = module_path.split(".")
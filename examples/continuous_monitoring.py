@@ -11,12 +11,16 @@ fairness metrics in production, including:
 
 Run this example:
     python examples/continuous_monitoring.py
+
+Set DEMO_PACE (seconds) to pause between monitoring periods, e.g.:
+    DEMO_PACE=0.5 python examples/continuous_monitoring.py
 """
 
+import os
 import time
-from datetime import datetime
 
 import numpy as np
+import pandas as pd
 from sklearn.datasets import make_classification
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
@@ -25,18 +29,33 @@ from justiceai import audit
 from justiceai.monitoring import (
     ConsoleAlertChannel,
     FairnessAlerting,
+    FairnessDriftDetector,
     MetricsDriftMonitor,
 )
 
+# Shared random generator for the simulation
+rng = np.random.default_rng(0)
+
+# Fairness metrics tracked by the monitor
+KEY_METRICS = ("statistical_parity", "equal_opportunity", "predictive_parity")
 
-def simulate_data_drift(X: np.ndarray, y: np.ndarray, drift_factor: float = 0.0):
+
+def simulate_data_drift(
+    X: np.ndarray,
+    y: np.ndarray,
+    drift_factor: float = 0.0,
+    noise_buf: np.ndarray | None = None,
+    X_out: np.ndarray | None = None,
+):
     """
     Simulate data drift by modifying distributions.
 
     Args:
-        X: Feature matrix
+        X: Feature matrix (floating point)
         y: Labels
         drift_factor: Amount of drift to introduce (0.0 = no drift, 1.0 = high drift)
+        noise_buf: Optional scratch buffer shaped like X, reused for the noise
+        X_out: Optional buffer shaped like X that receives the drifted features
 
     Returns:
         Drifted X and y
@@ -44,17 +63,22 @@ def simulate_data_drift(X: np.ndarray, y: np.ndarray, drift_factor: float = 0.0)
     if drift_factor == 0.0:
         return X, y
 
-    # Add noise proportional to drift factor
-    noise = np.random.normal(0, drift_factor, X.shape)
-    X_drifted = X + noise
+    if noise_buf is None:
+        noise_buf = np.empty_like(X)
+    if X_out is None:
+        X_out = np.empty_like(X)
+
+    # Add noise proportional to drift factor, without temporary arrays
+    rng.standard_normal(dtype=X.dtype, out=noise_buf)
+    noise_buf *= drift_factor
+    X_drifted = np.add(X, noise_buf, out=X_out)
 
     # Optionally flip some labels to simulate concept drift
     if drift_factor > 0.5:
         flip_ratio = (drift_factor - 0.5) * 0.2  # Up to 10% label flip
-        num_flips = int(len(y) * flip_ratio)
-        flip_indices = np.random.choice(len(y), num_flips, replace=False)
-        y_drifted = y.copy()
-        y_drifted[flip_indices] = 1 - y_drifted[flip_indices]
+        # Binary labels: XOR with a Bernoulli mask flips them in a single pass
+        flip_mask = rng.random(len(y)) < flip_ratio
+        y_drifted = y ^ flip_mask.astype(y.dtype)
         return X_drifted, y_drifted
 
     return X_drifted, y
@@ -70,31 +94,51 @@ def extract_fairness_metrics(audit_result) -> dict[str, float]:
     Returns:
         Dictionary of fairness metrics
     """
-    metrics = {}
     result = audit_result.fairness_result
 
     # Extract metrics for first protected attribute and first group
-    if result.protected_attrs:
-        first_attr = result.protected_attrs[0]
-        if first_attr in result.metrics:
-            # Get first group
-            first_group = list(result.metrics[first_attr].keys())[0]
-            group_metrics = result.metrics[first_attr][first_group]
+    first_attr = next(iter(result.protected_attrs), None)
+    if first_attr is None or first_attr not in result.metrics:
+        return {}
+
+    attr_metrics = result.metrics[first_attr]
+    first_group = next(iter(attr_metrics), None)
+    if first_group is None:
+        return {}
+
+    # Extract key metrics
+    group_metrics = attr_metrics[first_group]
+    return {name: group_metrics[name] for name in KEY_METRICS if name in group_metrics}
 
-            # Extract key metrics
-            for metric_name in [
-                "statistical_parity",
-                "equal_opportunity",
-                "predictive_parity",
-            ]:
-                if metric_name in group_metrics:
-                    metrics[metric_name] = group_metrics[metric_name]
 
-    return metrics
+def build_audit_frame(
+    X: np.ndarray, protected: np.ndarray, y: np.ndarray
+) -> pd.DataFrame:
+    """
+    Build the audit DataFrame (features, gender, target) in one constructor call.
+
+    Passing every column at once avoids the block consolidation triggered
+    by adding columns one at a time.
+
+    Args:
+        X: Feature matrix
+        protected: Protected attribute values
+        y: Labels
+
+    Returns:
+        DataFrame with feature columns 0..n-1, "gender" and "target"
+    """
+    columns = {i: X[:, i] for i in range(X.shape[1])}
+    columns["gender"] = protected
+    columns["target"] = y
+    return pd.DataFrame(columns, copy=False)
 
 
 def main():
     """Run continuous monitoring simulation."""
+    # Optional delay between periods (disabled by default so runs can be timed)
+    demo_pace = float(os.environ.get("DEMO_PACE", "0"))
+
     print("=" * 70)
     print("JusticeAI - Continuous Fairness Monitoring Example")
     print("=" * 70)
@@ -114,7 +158,7 @@ def main():
     )
 
     # Add protected attribute (e.g., gender: 0 or 1)
-    protected_attr = np.random.binomial(1, 0.5, size=len(y))
+    protected_attr = rng.integers(0, 2, size=len(y), dtype=np.uint8)
 
     # Split data
     X_train, X_test, y_train, y_test, protected_train, protected_test = (
@@ -126,11 +170,7 @@ def main():
     model.fit(X_train, y_train)
 
     # Run initial fairness audit
-    import pandas as pd
-
-    test_data = pd.DataFrame(X_test)
-    test_data["gender"] = protected_test
-    test_data["target"] = y_test
+    test_data = build_audit_frame(X_test, protected_test, y_test)
 
     baseline_report = audit(model, test_data, protected_attrs=["gender"], target="target")
 
@@ -152,6 +192,9 @@ def main():
         threshold=0.10,  # Alert if metric changes by more than 10%
     )
 
+    # Detector used to describe drift in alerts
+    detector = FairnessDriftDetector(baseline_metrics)
+
     # Setup alerting with console channel
     alerting = FairnessAlerting()
     alerting.add_channel("console", ConsoleAlertChannel())
@@ -168,31 +211,42 @@ def main():
     print("-" * 70)
     print()
 
+    # Generate the production data pool once and slice it per period
+    X_pool, y_pool = make_classification(
+        n_samples=3000,
+        n_features=10,
+        n_informative=5,
+        n_redundant=2,
+        random_state=42,
+    )
+
+    # Scratch buffers reused by simulate_data_drift across periods
+    noise_buf = np.empty_like(X_pool[:300])
+    X_buf = np.empty_like(X_pool[:300])
+
     # Simulate 10 time periods with increasing drift
     for period in range(1, 11):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] Period {period}/10")
 
         # Introduce gradual drift (increases over time)
         drift_factor = period * 0.08  # Gradually increase drift
 
-        # Generate new production data with drift
-        X_prod, y_prod = make_classification(
-            n_samples=300,
-            n_features=10,
-            n_informative=5,
-            n_redundant=2,
-            random_state=42 + period,
+        # Take this period's production data and apply drift
+        period_slice = slice((period - 1) * 300, period * 300)
+        X_prod, y_prod = simulate_data_drift(
+            X_pool[period_slice],
+            y_pool[period_slice],
+            drift_factor,
+            noise_buf=noise_buf,
+            X_out=X_buf,
         )
-        X_prod, y_prod = simulate_data_drift(X_prod, y_prod, drift_factor)
 
         # Add protected attribute
-        protected_prod = np.random.binomial(1, 0.5, size=len(y_prod))
+        protected_prod = rng.integers(0, 2, size=len(y_prod), dtype=np.uint8)
 
         # Create production DataFrame
-        prod_data = pd.DataFrame(X_prod)
-        prod_data["gender"] = protected_prod
-        prod_data["target"] = y_prod
+        prod_data = build_audit_frame(X_prod, protected_prod, y_prod)
 
         # Run fairness audit on production data
         prod_report = audit(model, prod_data, protected_attrs=["gender"], target="target")
@@ -210,9 +264,6 @@ def main():
             print(f"  Drifted metrics: {list(drift_result.drifted_metrics.keys())}")
 
             # Send alert
-            from justiceai.monitoring import FairnessDriftDetector
-
-            detector = FairnessDriftDetector(baseline_metrics)
             alerting.send_drift_alert(drift_result, detector, timestamp=timestamp)
         else:
             print(f"  ✓ No drift detected")
@@ -220,7 +271,8 @@ def main():
         print()
 
         # Small delay to simulate time passing
-        time.sleep(0.5)
+        if demo_pace:
+            time.sleep(demo_pace)
 
     # 4. Summary and trend analysis
     print("=" * 70)
@@ -240,11 +292,13 @@ def main():
     trends = monitor.get_drift_trend()
 
     for metric_name, scores in trends.items():
+        # Convert once instead of once per reduction
+        arr = np.asarray(scores, dtype=np.float64)
         print(f"\n{metric_name}:")
-        print(f"  Scores: {[f'{s:.4f}' for s in scores]}")
-        print(f"  Mean: {np.mean(scores):.4f}")
-        print(f"  Max: {np.max(scores):.4f}")
-        print(f"  Trend: {'↑ Increasing' if scores[-1] > scores[0] else '↓ Decreasing'}")
+        print(f"  Scores: {[f'{s:.4f}' for s in arr]}")
+        print(f"  Mean: {arr.mean():.4f}")
+        print(f"  Max: {arr.max():.4f}")
+        print(f"  Trend: {'↑ Increasing' if arr[-1] > arr[0] else '↓ Decreasing'}")
 
     print()
     print("=" * 70)
@@ -13,8 +13,8 @@ from sklearn.model_selection import train_test_split
 
 from justiceai.reports import FairnessReport
 
-# Set random seed for reproducibility
-np.random.seed(42)
+# Single seeded generator for reproducibility
+rng = np.random.default_rng(42)
 
 # Generate synthetic dataset
 print("Generating synthetic dataset...")
@@ -29,11 +29,17 @@ X, y = make_classification(
 
 # Create a sensitive attribute (e.g., gender)
 # With intentional bias: group A has higher positive rate
-sensitive = pd.Series(np.random.choice(["Group_A", "Group_B"], 1000))
+# (drawn as int8 codes, so no per-row Python strings are created)
+group_codes = rng.integers(0, 2, size=1000, dtype=np.int8)
+sensitive = pd.Series(
+    pd.Categorical.from_codes(group_codes, categories=["Group_A", "Group_B"])
+)
 
 # Make data slightly biased: Group A more likely to be class 1
-bias_mask = sensitive == "Group_A"
-y[bias_mask & (np.random.rand(1000) < 0.2)] = 1
+# (compare integer category codes rather than the strings)
+group_a_code = sensitive.cat.categories.get_loc("Group_A")
+bias_mask = (group_codes == group_a_code) & (rng.random(1000) < 0.2)
+y[bias_mask] = 1
 
 # Split data
 X_train, X_test, y_train, y_test, sens_train, sens_test = train_test_split(
@@ -45,10 +51,11 @@ print("Training RandomForest model...")
 model = RandomForestClassifier(n_estimators=100, random_state=42)
 model.fit(X_train, y_train)
 
-# Make predictions
+# Make predictions (a single forest traversal; same labels as model.predict)
 print("Making predictions...")
-y_pred = model.predict(X_test)
-y_pred_proba = model.predict_proba(X_test)[:, 1]
+proba = model.predict_proba(X_test)
+y_pred = model.classes_[proba.argmax(axis=1)]
+y_pred_proba = proba[:, 1]
 
 # Convert to DataFrame for pre-training metrics
 X_test_df = pd.DataFrame(X_test, columns=[f"feature_{i}" for i in range(10)])
@@ -21,8 +21,32 @@ __author__ = "Gustavo Haase"
 __email__ = "gustavo.haase@gmail.com"
 __license__ = "MIT"
 
-from justiceai.api import audit
-from justiceai.fairness_evaluator import FairnessEvaluator
-from justiceai.reports import FairnessReport
+import importlib
+from typing import Any
+
+# Public API, imported lazily on first access (PEP 562) so that importing
+# a subpackage such as justiceai.monitoring doesn't load the whole stack
+_LAZY_ATTRS = {
+    "audit": ("justiceai.api", "audit"),
+    "FairnessEvaluator": ("justiceai.fairness_evaluator", "FairnessEvaluator"),
+    "FairnessReport": ("justiceai.reports", "FairnessReport"),
+}
 
 __all__ = ["FairnessEvaluator", "FairnessReport", "audit"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API objects on first access."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -4,6 +4,7 @@ Convenience API functions.
 This module provides simple one-liner functions for common tasks.
 """
 
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
@@ -13,6 +14,12 @@ from justiceai.fairness_evaluator import FairnessEvaluator
 from justiceai.reports import FairnessReport
 
 
+@lru_cache(maxsize=8)
+def _get_evaluator(fairness_threshold: float) -> FairnessEvaluator:
+    """Return a shared evaluator for a threshold (evaluators are stateless)."""
+    return FairnessEvaluator(fairness_threshold=fairness_threshold)
+
+
 def audit(
     model: Any,
     X: pd.DataFrame | np.ndarray,
@@ -53,21 +60,19 @@ def audit(
         ...     show=True
         ... )
     """
-    # Create evaluator
-    evaluator = FairnessEvaluator(fairness_threshold=fairness_threshold)
+    # Reuse evaluator across calls (e.g. monitoring loops)
+    evaluator = _get_evaluator(fairness_threshold)
 
     # Evaluate
     report = evaluator.evaluate(model, X, y_true, sensitive_attrs)
 
-    # Save if requested
-    if output_path:
-        report.save_html(output_path)
-
-    # Show if requested
+    # Show if requested (show() saves the HTML itself, so it is written once)
     if show:
         if output_path:
             report.show(output_path)
         else:
             report.show()
+    elif output_path:
+        report.save_html(output_path)
 
     return report
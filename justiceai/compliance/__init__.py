@@ -21,7 +21,31 @@ Example:
     >>> bacen_reporter.save_html("bacen_compliance.html")
 """
 
-from justiceai.compliance.bacen import BACENComplianceReporter
-from justiceai.compliance.lgpd import LGPDComplianceReporter
+import importlib
+from typing import Any
+
+# Reporters are imported on first access (PEP 562), so using one
+# regulation doesn't load the other
+_LAZY_ATTRS = {
+    "LGPDComplianceReporter": "justiceai.compliance.lgpd",
+    "BACENComplianceReporter": "justiceai.compliance.bacen",
+}
 
 __all__ = ["LGPDComplianceReporter", "BACENComplianceReporter"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import compliance reporters on first access."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,83 @@
+"""
+Fairness disparities shared by the compliance reporters.
+
+Both reporters apply the 80% rule: each group's rate is compared to the
+best group's, ratios below 0.8 are disparities and below 0.6 they are
+high severity.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+# Ratio to the best group below which a group is a disparity (80% rule)
+DISPARITY_THRESHOLD = 0.8
+
+# Ratio below which a disparity is high severity
+HIGH_SEVERITY_THRESHOLD = 0.6
+
+
+@dataclass(frozen=True, slots=True)
+class Disparity:
+    """
+    A group falling below the fairness threshold for one metric.
+
+    Attributes:
+        atributo: Sensitive attribute label
+        grupo: Group identifier
+        metrica: Display name of the fairness metric
+        valor: Ratio of the group's rate to the best group's rate
+        threshold: Fairness threshold the ratio is compared against
+        desvio: How far the ratio falls below the threshold
+        severidade: 'Alta' or 'Média'
+    """
+
+    atributo: str
+    grupo: str
+    metrica: str
+    valor: float
+    threshold: float
+    desvio: float
+    severidade: str
+
+
+def scan_disparities(
+    groups: Sequence[str],
+    metrics: Sequence[str],
+    rates: np.ndarray,
+    threshold: float = DISPARITY_THRESHOLD,
+) -> tuple[Disparity, ...]:
+    """
+    Flag the groups whose rate falls below threshold times the best rate.
+
+    Args:
+        groups: Group names, one per row of rates
+        metrics: Display names of the metrics, one per column of rates
+        rates: (n_groups, n_metrics) rate matrix; NaN entries are not compared
+        threshold: Ratio to the best group below which a group is flagged
+
+    Returns:
+        Disparities metric by metric, in group order within each metric
+    """
+    # Ratio to the best group of each metric, flagged in one vectorized pass
+    ratios = np.full_like(rates, np.nan)
+    if len(groups):
+        best = np.nanmax(rates, axis=0, initial=0.0, where=~np.isnan(rates))
+        np.divide(rates, best, out=ratios, where=best > 0)
+    below = ratios < threshold
+    high = ratios < HIGH_SEVERITY_THRESHOLD
+
+    # Emit records metric by metric (transpose keeps that order)
+    return tuple(
+        Disparity(
+            atributo="Atributo sensível",
+            grupo=groups[i],
+            metrica=metrics[j],
+            valor=float(ratios[i, j]),
+            threshold=threshold,
+            desvio=threshold - float(ratios[i, j]),
+            severidade="Alta" if high[i, j] else "Média",
+        )
+        for j, i in np.argwhere(below.T)
+    )
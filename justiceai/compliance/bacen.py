@@ -11,11 +11,65 @@ BACEN Resolution 4.658/2018 requires:
 - Documentation and auditability
 """
 
-from typing import Any
+import html
+from collections import Counter
+from collections.abc import Iterator, Mapping
+from dataclasses import asdict
+from datetime import datetime
+from functools import cached_property
+from string import Template
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+import numpy as np
+
+from justiceai.compliance._disparities import Disparity, scan_disparities
+from justiceai.reports.fairness_report import FairnessReport
 
-import pandas as pd
+# Fixed part of the compliance HTML section, parsed once at import time
+_BACEN_SKELETON = Template(
+    """
+        <div style="margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-left: 4px solid #006400;">
+            <h2>🏦 Relatório de Conformidade BACEN</h2>
+            <p><strong>Resolução BACEN nº 4.658/2018</strong></p>
+            <p><em>Gestão de Risco de Modelos e Governança</em></p>
 
-from justiceai.reports.fairness_report import FairnessReport
+            <h3>1. Identificação do Modelo</h3>
+            <ul>
+                <li><strong>Tipo:</strong> $tipo</li>
+                <li><strong>Framework:</strong> $framework</li>
+                <li><strong>Finalidade:</strong> $finalidade</li>
+                <li><strong>Data de Validação:</strong> $data_validacao</li>
+            </ul>
+
+            <h3>2. Avaliação de Risco do Modelo</h3>
+            <div style="padding: 15px; background-color: white; border-left: 4px solid $risk_color; margin: 10px 0;">
+                <p style="margin: 0;"><strong>Nível de Risco:</strong>
+                    <span style="color: $risk_color; font-weight: bold; font-size: 1.2em;">
+                        $nivel_risco
+                    </span>
+                </p>
+                <p style="margin: 5px 0 0 0;">$descricao</p>
+            </div>
+            <ul>
+                <li><strong>Total de Disparidades:</strong> $total_disparidades</li>
+                <li><strong>Alta Severidade:</strong> $alta_severidade</li>
+                <li><strong>Média Severidade:</strong> $media_severidade</li>
+                <li><strong>Requer Ação Imediata:</strong> $acao_imediata</li>
+            </ul>
+        """
+)
+
+
+def _escape_tree(value: Any) -> Any:
+    """HTML-escape every string in a nested dict/list structure."""
+    if isinstance(value, str):
+        return html.escape(value)
+    if isinstance(value, dict):
+        return {k: _escape_tree(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_escape_tree(v) for v in value)
+    return value
 
 
 class BACENComplianceReporter:
@@ -49,6 +103,45 @@ class BACENComplianceReporter:
         BACEN Res. 4.658/2018: https://www.bcb.gov.br/estabilidadefinanceira/exibenormativo?tipo=Resolu%C3%A7%C3%A3o&numero=4658
     """
 
+    # (metric key, per-group rate key, display name) checked for disparities
+    _METRIC_SPECS: ClassVar[tuple[tuple[str, str, str], ...]] = (
+        ("statistical_parity", "selection_rate", "Statistical Parity"),
+        ("equal_opportunity", "tpr", "Equal Opportunity"),
+    )
+
+    # Highlight color for each risk level in the HTML section
+    _RISK_COLORS: ClassVar[dict[str, str]] = {
+        "ALTO": "#dc3545",
+        "MÉDIO": "#ffc107",
+        "BAIXO": "#28a745",
+    }
+
+    # Monitoring alert configuration (read-only; copied into each report)
+    _ALERT_CONFIG: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {
+            "threshold_fairness": 0.8,
+            "threshold_critico": 0.6,
+            "alertas_ativos": (
+                "Statistical Parity < 0.8",
+                "Equal Opportunity < 0.8",
+                "Predictive Parity < 0.8",
+            ),
+            "canais_notificacao": ("Email", "Dashboard", "API"),
+        }
+    )
+
+    # Recommendations that apply regardless of the risk level
+    _BASE_RECOMMENDATIONS: ClassVar[tuple[str, ...]] = (
+        "Manter documentação completa do modelo conforme Resolução BACEN 4.658/2018",
+        "Realizar validação periódica do modelo (mínimo trimestral)",
+        "Implementar controles de governança de modelos",
+        "Manter registro de todas as avaliações para fins de auditoria",
+    )
+    _CLOSING_RECOMMENDATIONS: ClassVar[tuple[str, ...]] = (
+        "Estabelecer processo de monitoramento contínuo com alertas automáticos",
+        "Capacitar equipe técnica em práticas de fairness e compliance",
+    )
+
     def __init__(self, fairness_report: FairnessReport):
         """
         Initialize BACEN Compliance Reporter.
@@ -58,6 +151,8 @@ class BACENComplianceReporter:
         """
         self.fairness_report = fairness_report
         self.compliance_data: dict[str, Any] = {}
+        self._escaped: dict[str, Any] = {}
+        self._base_html: str | None = None
 
     def generate_report(self) -> dict[str, Any]:
         """
@@ -80,17 +175,15 @@ class BACENComplianceReporter:
         """
         # Extract data from fairness report
         summary = self.fairness_report.get_summary()
-        issues = self.fairness_report.get_issues()
         metrics_data = self.fairness_report.metrics
-
-        num_issues = len(issues) if issues else 0
+        disparities = self._disparities
 
         # 1. Identificação do Modelo
         self.compliance_data["identificacao_modelo"] = {
             "tipo": "Modelo de Classificação Binária",
             "framework": "Classificador ML",
             "finalidade": "Apoio à decisão automatizada",
-            "data_validacao": pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "data_validacao": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "versao_avaliacao": "1.0",
         }
 
@@ -98,7 +191,7 @@ class BACENComplianceReporter:
         self.compliance_data["validacao_modelo"] = {
             "metricas_calculadas": len(metrics_data) if metrics_data else 0,
             "atributos_sensíveis_analisados": list(summary.get("by_group", {}).keys()) if summary else [],
-            "grupos_avaliados": summary.get("by_group", {}) if summary else {},
+            "grupos_avaliados": self._analyzed_groups,
             "metodologia": "Análise de Fairness com múltiplas métricas",
         }
 
@@ -111,32 +204,110 @@ class BACENComplianceReporter:
         }
 
         # 4. Risco do Modelo
-        self.compliance_data["risco_modelo"] = self._assess_model_risk(num_issues)
+        self.compliance_data["risco_modelo"] = self._model_risk
 
         # 5. Monitoramento
         self.compliance_data["monitoramento"] = {
-            "metricas_monitoradas": list(metrics_data.keys()) if metrics_data else [],
+            "metricas_monitoradas": self._monitored_metrics,
             "alertas_configurados": self._get_alert_configuration(),
             "frequencia_monitoramento": "Contínuo",
         }
 
         # 6. Fairness Assessment
         self.compliance_data["fairness_assessment"] = {
-            "disparidades_identificadas": issues if issues else [],
-            "nivel_risco_fairness": self._assess_fairness_risk(num_issues),
-            "ações_mitigacao": self._suggest_mitigation_actions(num_issues),
+            "disparidades_identificadas": [asdict(d) for d in disparities],
+            "nivel_risco_fairness": self._assess_fairness_risk(disparities),
+            "ações_mitigacao": self._mitigation_actions,
         }
 
         # 7. Recomendações
-        self.compliance_data["recomendacoes"] = self._generate_recommendations(num_issues)
+        self.compliance_data["recomendacoes"] = self._recommendations
+
+        # Escape once here so rendering can interpolate the values directly
+        self._escaped = {k: _escape_tree(v) for k, v in self.compliance_data.items()}
 
         return self.compliance_data
 
-    def _assess_model_risk(self, num_issues: int) -> dict[str, Any]:
-        """Assess model risk according to BACEN criteria."""
-        # Risk classification based on number of issues
-        num_high_severity = num_issues  # Simplified
-        num_medium_severity = 0
+    @cached_property
+    def _metrics_scan(self) -> tuple[list[str], list[str], tuple[Disparity, ...]]:
+        """
+        Walk the per-group post-training metrics once.
+
+        The analyzed groups, the monitored metric names and the disparities
+        are all collected from the same traversal, since several report
+        sections use them.
+
+        Returns:
+            Tuple of (groups, metric names, disparities)
+        """
+        posttrain = self.fairness_report.metrics.get("posttrain", {})
+
+        specs = self._METRIC_SPECS
+        spec_index = {key: j for j, (key, _, _) in enumerate(specs)}
+
+        # Single pass: collect groups and metric names, and fill a
+        # (group x metric) rate matrix for the disparity specs
+        group_index: dict[str, int] = {}
+        metric_names = []
+        spec_rates: list[dict[int, float]] = [{} for _ in specs]
+        for metric_key, values in posttrain.items():
+            by_group = values.get("by_group") if isinstance(values, dict) else None
+            if not isinstance(by_group, dict):
+                continue
+            metric_names.append(metric_key)
+            j = spec_index.get(metric_key)
+            if j is None:
+                for group in by_group:
+                    group_index.setdefault(group, len(group_index))
+                continue
+            # Bind the target column and rate key once per metric
+            column = spec_rates[j]
+            rate_key = specs[j][1]
+            for group, group_values in by_group.items():
+                i = group_index.setdefault(group, len(group_index))
+                # Single lookup; groups without the rate stay NaN (not compared)
+                rate = group_values.get(rate_key)
+                if rate is not None:
+                    column[i] = rate
+
+        groups = [str(g) for g in group_index]
+        rates = np.full((len(groups), len(specs)), np.nan)
+        for j, column in enumerate(spec_rates):
+            for i, rate in column.items():
+                rates[i, j] = rate
+
+        metrics = [display for _, _, display in specs]
+        return groups, metric_names, scan_disparities(groups, metrics, rates)
+
+    @cached_property
+    def _analyzed_groups(self) -> list[str]:
+        """Groups present in the per-group metrics."""
+        return self._metrics_scan[0]
+
+    @cached_property
+    def _monitored_metrics(self) -> list[str]:
+        """Names of the per-group (monitorable) metrics."""
+        return self._metrics_scan[1]
+
+    @cached_property
+    def _disparities(self) -> tuple[Disparity, ...]:
+        """
+        Groups below the 80% rule for each fairness metric.
+
+        Each group's selection rate / TPR is compared to the best group's;
+        ratios below 0.8 are disparities, and below 0.6 they are high severity.
+        """
+        return self._metrics_scan[2]
+
+    @cached_property
+    def _model_risk(self) -> dict[str, Any]:
+        """Model risk assessment according to BACEN criteria."""
+        disparities = self._disparities
+
+        # Risk classification based on disparity severity (counted in one pass)
+        severity_counts = Counter(d.severidade for d in disparities)
+        num_high_severity = severity_counts["Alta"]
+        num_medium_severity = severity_counts["Média"]
 
         if num_high_severity > 0:
             risk_level = "ALTO"
@@ -155,7 +326,7 @@ class BACENComplianceReporter:
         return {
             "nivel_risco": risk_level,
             "descricao": risk_description,
-            "total_disparidades": num_issues,
+            "total_disparidades": len(disparities),
             "disparidades_alta_severidade": num_high_severity,
             "disparidades_media_severidade": num_medium_severity,
             "requer_acao_imediata": num_high_severity > 0,
@@ -164,19 +335,11 @@ class BACENComplianceReporter:
 
     def _get_alert_configuration(self) -> dict[str, Any]:
         """Get alert configuration for monitoring."""
-        return {
-            "threshold_fairness": 0.8,
-            "threshold_critico": 0.6,
-            "alertas_ativos": [
-                "Statistical Parity < 0.8",
-                "Equal Opportunity < 0.8",
-                "Predictive Parity < 0.8",
-            ],
-            "canais_notificacao": ["Email", "Dashboard", "API"],
-        }
+        return dict(self._ALERT_CONFIG)
 
-    def _assess_fairness_risk(self, num_issues: int) -> str:
+    def _assess_fairness_risk(self, disparities: tuple[Disparity, ...]) -> str:
         """Assess overall fairness risk level."""
+        num_issues = len(disparities)
         if num_issues > 2:
             return "ALTO"
         elif num_issues > 0:
@@ -184,11 +347,12 @@ class BACENComplianceReporter:
         else:
             return "BAIXO"
 
-    def _suggest_mitigation_actions(self, num_issues: int) -> list[str]:
-        """Suggest mitigation actions for identified risks."""
+    @cached_property
+    def _mitigation_actions(self) -> list[str]:
+        """Suggested mitigation actions for identified risks."""
         actions = []
 
-        if num_issues == 0:
+        if not self._disparities:
             actions.append(
                 "Manter monitoramento contínuo das métricas de fairness"
             )
@@ -217,37 +381,29 @@ class BACENComplianceReporter:
 
         return actions
 
-    def _generate_recommendations(self, num_issues: int) -> list[str]:
-        """Generate BACEN compliance recommendations."""
+    @cached_property
+    def _recommendations(self) -> list[str]:
+        """BACEN compliance recommendations."""
+        num_issues = len(self._disparities)
         risk_level = "ALTO" if num_issues > 2 else "MÉDIO" if num_issues > 0 else "BAIXO"
 
-        recommendations = [
-            "Manter documentação completa do modelo conforme Resolução BACEN 4.658/2018",
-            "Realizar validação periódica do modelo (mínimo trimestral)",
-            "Implementar controles de governança de modelos",
-            "Manter registro de todas as avaliações para fins de auditoria",
-        ]
-
+        recommendations = []
         if risk_level == "ALTO":
-            recommendations.insert(
-                0,
-                "⚠️ AÇÃO URGENTE: Risco ALTO identificado. "
-                "Revisar modelo antes de uso em produção.",
-            )
             recommendations.append(
-                "Considerar suspensão do modelo até mitigação dos riscos identificados"
+                "⚠️ AÇÃO URGENTE: Risco ALTO identificado. "
+                "Revisar modelo antes de uso em produção."
             )
         elif risk_level == "MÉDIO":
-            recommendations.insert(
-                0, "Risco MÉDIO: Implementar plano de mitigação no curto prazo."
+            recommendations.append(
+                "Risco MÉDIO: Implementar plano de mitigação no curto prazo."
             )
 
-        recommendations.append(
-            "Estabelecer processo de monitoramento contínuo com alertas automáticos"
-        )
-        recommendations.append(
-            "Capacitar equipe técnica em práticas de fairness e compliance"
-        )
+        recommendations.extend(self._BASE_RECOMMENDATIONS)
+        if risk_level == "ALTO":
+            recommendations.append(
+                "Considerar suspensão do modelo até mitigação dos riscos identificados"
+            )
+        recommendations.extend(self._CLOSING_RECOMMENDATIONS)
 
         return recommendations
 
@@ -264,96 +420,91 @@ class BACENComplianceReporter:
         if not self.compliance_data:
             self.generate_report()
 
-        html_content = self._generate_html()
-
+        # Write the pieces as they come instead of joining the whole document
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            f.writelines(self._iter_html())
 
     def _generate_html(self) -> str:
         """Generate HTML content for BACEN compliance report."""
-        # Start with fairness report HTML
-        base_html = self.fairness_report.render_html()
+        return "".join(self._iter_html())
+
+    def _iter_html(self) -> Iterator[str]:
+        """Yield the BACEN HTML report in chunks (prefix, section, suffix)."""
+        # Start with fairness report HTML (rendered once, reused on later saves)
+        if self._base_html is None:
+            self._base_html = self.fairness_report.render_html()
+        base_html = self._base_html
 
         # Add BACEN compliance section
         compliance_section = self._create_compliance_section_html()
 
-        # Insert compliance section before closing body tag
-        html_with_compliance = base_html.replace(
-            "</body>", f"{compliance_section}</body>"
-        )
-
-        return html_with_compliance
+        # Insert compliance section before the closing body tag
+        idx = base_html.rfind("</body>")
+        if idx < 0:
+            idx = len(base_html)
+        yield base_html[:idx]
+        yield compliance_section
+        yield base_html[idx:]
 
     def _create_compliance_section_html(self) -> str:
         """Create HTML section for BACEN compliance."""
-        if not self.compliance_data:
+        if not self._escaped:
             self.generate_report()
 
+        # Bind the (HTML-escaped) sections once instead of re-indexing per field
+        escaped = self._escaped
+        ident = escaped["identificacao_modelo"]
+        risco = escaped["risco_modelo"]
+        fair = escaped["fairness_assessment"]
+
         # Determine risk color
-        risk_level = self.compliance_data["risco_modelo"]["nivel_risco"]
-        risk_color = {"ALTO": "#dc3545", "MÉDIO": "#ffc107", "BAIXO": "#28a745"}.get(
-            risk_level, "#6c757d"
+        risk_color = self._RISK_COLORS.get(risco["nivel_risco"], "#6c757d")
+
+        header = _BACEN_SKELETON.substitute(
+            tipo=ident["tipo"],
+            framework=ident["framework"],
+            finalidade=ident["finalidade"],
+            data_validacao=ident["data_validacao"],
+            risk_color=risk_color,
+            nivel_risco=risco["nivel_risco"],
+            descricao=risco["descricao"],
+            total_disparidades=risco["total_disparidades"],
+            alta_severidade=risco["disparidades_alta_severidade"],
+            media_severidade=risco["disparidades_media_severidade"],
+            acao_imediata="Sim" if risco["requer_acao_imediata"] else "Não",
         )
 
-        html = f"""
-        <div style="margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-left: 4px solid #006400;">
-            <h2>🏦 Relatório de Conformidade BACEN</h2>
-            <p><strong>Resolução BACEN nº 4.658/2018</strong></p>
-            <p><em>Gestão de Risco de Modelos e Governança</em></p>
-
-            <h3>1. Identificação do Modelo</h3>
-            <ul>
-                <li><strong>Tipo:</strong> {self.compliance_data['identificacao_modelo']['tipo']}</li>
-                <li><strong>Framework:</strong> {self.compliance_data['identificacao_modelo']['framework']}</li>
-                <li><strong>Finalidade:</strong> {self.compliance_data['identificacao_modelo']['finalidade']}</li>
-                <li><strong>Data de Validação:</strong> {self.compliance_data['identificacao_modelo']['data_validacao']}</li>
-            </ul>
-
-            <h3>2. Avaliação de Risco do Modelo</h3>
-            <div style="padding: 15px; background-color: white; border-left: 4px solid {risk_color}; margin: 10px 0;">
-                <p style="margin: 0;"><strong>Nível de Risco:</strong>
-                    <span style="color: {risk_color}; font-weight: bold; font-size: 1.2em;">
-                        {self.compliance_data['risco_modelo']['nivel_risco']}
-                    </span>
-                </p>
-                <p style="margin: 5px 0 0 0;">{self.compliance_data['risco_modelo']['descricao']}</p>
-            </div>
-            <ul>
-                <li><strong>Total de Disparidades:</strong> {self.compliance_data['risco_modelo']['total_disparidades']}</li>
-                <li><strong>Alta Severidade:</strong> {self.compliance_data['risco_modelo']['disparidades_alta_severidade']}</li>
-                <li><strong>Média Severidade:</strong> {self.compliance_data['risco_modelo']['disparidades_media_severidade']}</li>
-                <li><strong>Requer Ação Imediata:</strong> {'Sim' if self.compliance_data['risco_modelo']['requer_acao_imediata'] else 'Não'}</li>
-            </ul>
-        """
+        # Accumulate the variable-length sections and join once at the end
+        parts = [header]
 
         # Add disparities if any
-        disparities = self.compliance_data["fairness_assessment"][
-            "disparidades_identificadas"
-        ]
+        disparities = fair["disparidades_identificadas"]
         if disparities:
-            html += "<h3>⚠️ Disparidades Identificadas</h3><ul>"
-            for disp in disparities:
-                html += f"""
+            parts.append("<h3>⚠️ Disparidades Identificadas</h3><ul>")
+            parts.extend(
+                f"""
                     <li><strong>{disp['atributo']} - {disp['grupo']}:</strong>
                         {disp['metrica']} = {disp['valor']:.3f}
                         (Desvio: {disp['desvio']:.3f}, Severidade: {disp['severidade']})
                     </li>
                 """
-            html += "</ul>"
+                for disp in disparities
+            )
+            parts.append("</ul>")
 
         # Add mitigation actions
-        html += "<h3>3. Ações de Mitigação Recomendadas</h3><ul>"
-        for action in self.compliance_data["fairness_assessment"]["ações_mitigacao"]:
-            html += f"<li>{action}</li>"
-        html += "</ul>"
+        actions = fair["ações_mitigacao"]
+        parts.append("<h3>3. Ações de Mitigação Recomendadas</h3><ul>")
+        parts.extend(f"<li>{action}</li>" for action in actions)
+        parts.append("</ul>")
 
         # Add governance recommendations
-        html += "<h3>4. Recomendações de Governança</h3><ul>"
-        for rec in self.compliance_data["recomendacoes"]:
-            html += f"<li>{rec}</li>"
-        html += "</ul>"
+        parts.append("<h3>4. Recomendações de Governança</h3><ul>")
+        parts.extend(f"<li>{rec}</li>" for rec in escaped["recomendacoes"])
+        parts.append("</ul>")
 
-        html += """
+        parts.append(
+            """
             <hr>
             <p style="font-size: 0.9em; color: #666;">
                 <strong>Base Legal:</strong> Resolução BACEN nº 4.658/2018<br>
@@ -361,8 +512,9 @@ class BACENComplianceReporter:
             </p>
         </div>
         """
+        )
 
-        return html
+        return "".join(parts)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -10,12 +10,56 @@ The LGPD Article 20 requires:
 - Assessment of fairness and bias in models
 """
 
+import contextlib
+import html
+import os
+from dataclasses import asdict
+from datetime import datetime
 from typing import Any
 
-import pandas as pd
+import numpy as np
 
+from justiceai.compliance._disparities import Disparity, scan_disparities
 from justiceai.reports.fairness_report import FairnessReport
 
+# Static pieces of the compliance HTML section, defined once at import time
+_HEADER_TMPL = """
+        <div style="margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-left: 4px solid #0066cc;">
+            <h2>📋 Relatório de Conformidade LGPD</h2>
+            <p><strong>Lei Geral de Proteção de Dados - Art. 20</strong></p>
+            <p><em>Direito à Explicação e Transparência Algorítmica</em></p>
+
+            <h3>1. Transparência Algorítmica</h3>
+            <ul>
+                <li><strong>Objetivo:</strong> {objetivo}</li>
+                <li><strong>Tipo de Modelo:</strong> {tipo_modelo}</li>
+                <li><strong>Atributos Protegidos:</strong> {atributos_protegidos}</li>
+                <li><strong>Data da Avaliação:</strong> {data_avaliacao}</li>
+            </ul>
+
+            <h3>2. Avaliação de Fairness</h3>
+            <ul>
+                <li><strong>Total de Métricas Calculadas:</strong> {total_metricas}</li>
+                <li><strong>Grupos Comparados:</strong> {grupos_comparados}</li>
+            </ul>
+        """
+
+_DISPARITY_ITEM_TMPL = """
+                    <li><strong>{atributo} - {grupo}:</strong>
+                        {metrica} = {valor:.3f}
+                        (Threshold: {threshold}, Severidade: {severidade})
+                    </li>
+                """
+
+_FOOTER_HTML = """
+            <hr>
+            <p style="font-size: 0.9em; color: #666;">
+                <strong>Base Legal:</strong> Lei nº 13.709/2018 (LGPD) - Artigo 20<br>
+                Este relatório documenta a transparência algorítmica conforme exigido pela legislação brasileira.
+            </p>
+        </div>
+        """
+
 
 class LGPDComplianceReporter:
     """
@@ -55,6 +99,8 @@ class LGPDComplianceReporter:
         """
         self.fairness_report = fairness_report
         self.compliance_data: dict[str, Any] = {}
+        self._metrics_scan: tuple[tuple[str, ...], tuple[Disparity, ...]] | None = None
+        self._base_html: str | None = None
 
     def generate_report(self) -> dict[str, Any]:
         """
@@ -74,12 +120,14 @@ class LGPDComplianceReporter:
             >>> print(compliance_doc['transparencia_algoritmica']['objetivo'])
             'Sistema de apoio à decisão usando Machine Learning...'
         """
-        # Extract data from fairness report
+        # Extract data from fairness report (each lookup done once)
         summary = self.fairness_report.get_summary()
-        issues = self.fairness_report.get_issues()
+        by_group = summary.get("by_group", {}) if summary else {}
+        group_names = tuple(by_group)
 
         # Get metrics data
         metrics_data = self.fairness_report.metrics
+        compared_groups, disparities = self._scan_metrics()
 
         # 1. Transparência Algorítmica
         self.compliance_data["transparencia_algoritmica"] = {
@@ -88,42 +136,80 @@ class LGPDComplianceReporter:
                 "para classificação binária."
             ),
             "tipo_modelo": "Classificador Binário",
-            "atributos_protegidos": list(summary.get("by_group", {}).keys()) if summary else [],
-            "grupos_analisados": summary.get("by_group", {}) if summary else {},
-            "data_avaliacao": pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "atributos_protegidos": group_names,
+            "grupos_analisados": by_group,
+            "data_avaliacao": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
         # 2. Critérios de Decisão
         self.compliance_data["criterios_decisao"] = {
             "metricas_performance": summary.get("overall", {}) if summary else {},
-            "metricas_fairness": summary.get("by_group", {}) if summary else {},
+            "metricas_fairness": by_group,
             "threshold_decisao": 0.5,
         }
 
         # 3. Avaliação de Fairness
-        num_issues = len(issues) if issues else 0
+        metric_names = list(metrics_data) if metrics_data else []
         self.compliance_data["avaliacao_fairness"] = {
-            "metricas_calculadas": list(metrics_data.keys()) if metrics_data else [],
-            "total_metricas": len(metrics_data) if metrics_data else 0,
-            "grupos_comparados": list(summary.get("by_group", {}).keys()) if summary else [],
-            "disparidades_identificadas": issues if issues else [],
+            "metricas_calculadas": metric_names,
+            "total_metricas": len(metric_names),
+            "grupos_comparados": compared_groups,
+            "disparidades_identificadas": [asdict(d) for d in disparities],
         }
 
         # 4. Grupos Protegidos
-        self.compliance_data["grupos_protegidos"] = summary.get("by_group", {}) if summary else {}
+        self.compliance_data["grupos_protegidos"] = by_group
 
         # 5. Métricas de Bias
         self.compliance_data["metricas_bias"] = {
-            "total_atributos_protegidos": len(summary.get("by_group", {})) if summary else 0,
-            "total_disparidades": num_issues,
-            "metricas_por_atributo": summary.get("by_group", {}) if summary else {},
+            "total_atributos_protegidos": len(group_names),
+            "total_disparidades": len(disparities),
+            "metricas_por_atributo": by_group,
         }
 
         # 6. Recomendações
-        self.compliance_data["recomendacoes"] = self._generate_recommendations(num_issues)
+        self.compliance_data["recomendacoes"] = self._generate_recommendations(
+            len(disparities)
+        )
 
         return self.compliance_data
 
+    def _scan_metrics(self) -> tuple[tuple[str, ...], tuple[Disparity, ...]]:
+        """
+        Walk the per-group post-training metrics once.
+
+        The compared groups and the statistical parity disparities are
+        collected in the same traversal and cached.
+
+        Returns:
+            Tuple of (groups, disparities)
+        """
+        if self._metrics_scan is not None:
+            return self._metrics_scan
+
+        posttrain = self.fairness_report.metrics.get("posttrain", {})
+
+        # Group names are converted once and shared as immutable tuples
+        groups: dict[str, None] = {}
+        rate_groups: tuple[str, ...] = ()
+        rate_values: tuple[float, ...] = ()
+        for metric_key, values in posttrain.items():
+            by_group = values.get("by_group") if isinstance(values, dict) else None
+            if not isinstance(by_group, dict):
+                continue
+            names = tuple(map(str, by_group))
+            groups.update(dict.fromkeys(names))
+            if metric_key == "statistical_parity":
+                rate_groups = names
+                rate_values = tuple(v["selection_rate"] for v in by_group.values())
+
+        # Each group's selection rate relative to the best group (80% rule)
+        rates = np.array(rate_values, dtype=np.float64).reshape(-1, 1)
+        disparities = scan_disparities(rate_groups, ["Statistical Parity"], rates)
+
+        self._metrics_scan = (tuple(groups), disparities)
+        return self._metrics_scan
+
     def _generate_recommendations(self, num_issues: int) -> list[str]:
         """Generate compliance recommendations."""
         recommendations = [
@@ -171,87 +257,81 @@ class LGPDComplianceReporter:
             self.generate_report()
 
         # Use the fairness report HTML as base and add compliance section
-        html_content = self._generate_html()
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        data = self._generate_html().encode("utf-8")
+
+        # Write to a temporary file and swap it in, so readers never see a
+        # partially written report
+        tmp_path = f"{output_path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            # Don't leave the partial temporary file behind
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
 
     def _generate_html(self) -> str:
         """Generate HTML content for LGPD compliance report."""
-        # Start with fairness report HTML
-        base_html = self.fairness_report.render_html()
+        # Start with fairness report HTML (rendered once, reused on later saves)
+        if self._base_html is None:
+            self._base_html = self.fairness_report.render_html()
+        base_html = self._base_html
 
         # Add LGPD compliance section
         compliance_section = self._create_compliance_section_html()
 
-        # Insert compliance section before closing body tag
-        html_with_compliance = base_html.replace(
-            "</body>", f"{compliance_section}</body>"
-        )
-
-        return html_with_compliance
+        # Insert compliance section before the closing body tag
+        idx = base_html.rfind("</body>")
+        if idx < 0:
+            idx = len(base_html)
+        return base_html[:idx] + compliance_section + base_html[idx:]
 
     def _create_compliance_section_html(self) -> str:
         """Create HTML section for LGPD compliance."""
         if not self.compliance_data:
             self.generate_report()
 
-        html = """
-        <div style="margin-top: 40px; padding: 20px; background-color: #f8f9fa; border-left: 4px solid #0066cc;">
-            <h2>📋 Relatório de Conformidade LGPD</h2>
-            <p><strong>Lei Geral de Proteção de Dados - Art. 20</strong></p>
-            <p><em>Direito à Explicação e Transparência Algorítmica</em></p>
-
-            <h3>1. Transparência Algorítmica</h3>
-            <ul>
-        """
-
+        # Only attribute and group names come from user data; the rest of
+        # the section is fixed text and needs no escaping
         trans = self.compliance_data["transparencia_algoritmica"]
-        html += f"""
-                <li><strong>Objetivo:</strong> {trans['objetivo']}</li>
-                <li><strong>Tipo de Modelo:</strong> {trans['tipo_modelo']}</li>
-                <li><strong>Atributos Protegidos:</strong> {', '.join(trans['atributos_protegidos'])}</li>
-                <li><strong>Data da Avaliação:</strong> {trans['data_avaliacao']}</li>
-            </ul>
-
-            <h3>2. Avaliação de Fairness</h3>
-            <ul>
-                <li><strong>Total de Métricas Calculadas:</strong> {self.compliance_data['avaliacao_fairness']['total_metricas']}</li>
-                <li><strong>Grupos Comparados:</strong> {', '.join(self.compliance_data['avaliacao_fairness']['grupos_comparados'])}</li>
-            </ul>
-        """
+        assessment = self.compliance_data["avaliacao_fairness"]
+        attrs = ", ".join(map(html.escape, trans["atributos_protegidos"]))
+        groups = ", ".join(map(html.escape, assessment["grupos_comparados"]))
+        parts = [
+            _HEADER_TMPL.format_map(
+                {
+                    "objetivo": trans["objetivo"],
+                    "tipo_modelo": trans["tipo_modelo"],
+                    "atributos_protegidos": attrs,
+                    "data_avaliacao": trans["data_avaliacao"],
+                    "total_metricas": assessment["total_metricas"],
+                    "grupos_comparados": groups,
+                }
+            )
+        ]
 
         # Add disparities if any
-        disparities = self.compliance_data["avaliacao_fairness"][
-            "disparidades_identificadas"
-        ]
+        disparities = assessment["disparidades_identificadas"]
         if disparities:
-            html += "<h3>⚠️ Disparidades Identificadas</h3><ul>"
-            for disp in disparities:
-                html += f"""
-                    <li><strong>{disp['atributo']} - {disp['grupo']}:</strong>
-                        {disp['metrica']} = {disp['valor']:.3f}
-                        (Threshold: {disp['threshold']}, Severidade: {disp['severidade']})
-                    </li>
-                """
-            html += "</ul>"
+            parts.append("<h3>⚠️ Disparidades Identificadas</h3><ul>")
+            parts.extend(
+                _DISPARITY_ITEM_TMPL.format_map(
+                    {**disp, "grupo": html.escape(disp["grupo"])}
+                )
+                for disp in disparities
+            )
+            parts.append("</ul>")
 
         # Add recommendations
-        html += "<h3>3. Recomendações de Conformidade</h3><ul>"
-        for rec in self.compliance_data["recomendacoes"]:
-            html += f"<li>{rec}</li>"
-        html += "</ul>"
+        parts.append("<h3>3. Recomendações de Conformidade</h3><ul>")
+        parts.extend(f"<li>{rec}</li>" for rec in self.compliance_data["recomendacoes"])
+        parts.append("</ul>")
 
-        html += """
-            <hr>
-            <p style="font-size: 0.9em; color: #666;">
-                <strong>Base Legal:</strong> Lei nº 13.709/2018 (LGPD) - Artigo 20<br>
-                Este relatório documenta a transparência algorítmica conforme exigido pela legislação brasileira.
-            </p>
-        </div>
-        """
+        parts.append(_FOOTER_HTML)
 
-        return html
+        return "".join(parts)
 
     def to_dict(self) -> dict[str, Any]:
         """
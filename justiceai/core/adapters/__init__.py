@@ -18,20 +18,19 @@ Example:
     >>> predictions = adapter.predict(X_test)
 """
 
+import importlib
+from typing import Any
+
 from justiceai.core.adapters.base_adapter import BaseModelAdapter
 from justiceai.core.adapters.model_factory import create_adapter, is_model_supported
 from justiceai.core.adapters.sklearn_adapter import SklearnAdapter
 
-# Optional adapters (imported only if dependencies are installed)
-try:
-    from justiceai.core.adapters.xgboost_adapter import XGBoostAdapter
-except ImportError:
-    XGBoostAdapter = None  # type: ignore
-
-try:
-    from justiceai.core.adapters.lightgbm_adapter import LightGBMAdapter
-except ImportError:
-    LightGBMAdapter = None  # type: ignore
+# Optional adapters are imported on first access (PEP 562), so importing
+# this package doesn't parse them up front
+_LAZY_ATTRS = {
+    "XGBoostAdapter": "justiceai.core.adapters.xgboost_adapter",
+    "LightGBMAdapter": "justiceai.core.adapters.lightgbm_adapter",
+}
 
 __all__ = [
     "BaseModelAdapter",
@@ -41,3 +40,23 @@ __all__ = [
     "create_adapter",
     "is_model_supported",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import optional adapters on first access (None if unavailable)."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        value = None
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -6,11 +6,31 @@ JusticeAI to work with different ML frameworks.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
 
 
+def _as_ndarray(x: Any) -> np.ndarray:
+    """Return x unchanged if it is exactly an ndarray, else np.asarray(x)."""
+    return x if type(x) is np.ndarray else np.asarray(x)
+
+
+def _binarize(probas: np.ndarray, threshold: float = 0.5) -> np.ndarray:
+    """Threshold probabilities into int64 0/1 labels in a single pass."""
+    out = np.empty(probas.shape, dtype=np.int64)
+    np.greater(probas, threshold, out=out)
+    return out
+
+
+def _positive_column_if_binary(proba: np.ndarray) -> np.ndarray:
+    """Positive-class column of a binary output, other outputs as is."""
+    if proba.ndim == 2 and proba.shape[1] == 2:
+        return proba[:, 1]
+    return proba
+
+
 class BaseModelAdapter(ABC):
     """
     Abstract base class for model adapters.
@@ -19,6 +39,10 @@ class BaseModelAdapter(ABC):
     frameworks (scikit-learn, XGBoost, LightGBM, ONNX, etc.) by providing
     a unified interface for predictions.
 
+    Attributes:
+        model: Wrapped ML model
+        supports_proba: Whether the model can produce probabilities
+
     Example:
         >>> class MyAdapter(BaseModelAdapter):
         ...     def predict(self, X):
@@ -28,6 +52,9 @@ class BaseModelAdapter(ABC):
         ...         return self.model.predict_proba(X)
     """
 
+    # Completes "Model <name> must ..." in validation errors
+    _model_requirement = "have a 'predict' method"
+
     def __init__(self, model: Any):
         """
         Initialize adapter with model.
@@ -36,7 +63,134 @@ class BaseModelAdapter(ABC):
             model: ML model instance
         """
         self.model = model
+        # Resolved once; predict paths dispatch on these in tight loops
+        self._model_class_name = type(model).__name__
+        self._is_booster = self._model_class_name == "Booster"
+        self._has_predict_proba = hasattr(model, "predict_proba")
+        self._proba_cache_key: tuple | None = None
+        self._proba_cache_val: np.ndarray | None = None
         self._validate_model()
+        self.supports_proba = self._check_supports_proba()
+        self._bind_predictors()
+
+    def _bind_predictors(self) -> None:
+        """
+        Resolve model-specific predict implementations once.
+
+        The model does not change after construction, so subclasses can
+        pick their prediction paths here instead of branching per call.
+        """
+        # Default adapters dispatch inside predict/predict_proba; nothing to bind
+        return None
+
+    def _check_supports_proba(self) -> bool:
+        """
+        Check if model supports probability predictions.
+
+        Returns:
+            True if predict_proba is available
+        """
+        return self._has_predict_proba
+
+    def _remember_proba(
+        self, X: np.ndarray | Any, compute: Callable[[Any], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Run the model on X, keeping the output for a following predict_proba.
+
+        Booster labels are thresholded probabilities, and callers usually
+        ask for labels and then probabilities of the same input. The output
+        is kept keyed by the identity, shape and dtype of X (and the model)
+        until _recall_proba hands it over.
+
+        Args:
+            X: Input features
+            compute: Function running the model on the converted X
+
+        Returns:
+            Raw model output for X
+        """
+        result = compute(self._prepare_X(X))
+        self._proba_cache_key = self._proba_key(X)
+        self._proba_cache_val = result
+        return result
+
+    def _recall_proba(
+        self, X: np.ndarray | Any, compute: Callable[[Any], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Output kept by _remember_proba for X, or compute(X) if there is none.
+
+        A kept output is handed over once and then forgotten, so the caller
+        owns the returned array and later calls run the model again.
+
+        Args:
+            X: Input features
+            compute: Function running the model on the converted X
+
+        Returns:
+            Raw model output for X
+        """
+        cached = self._proba_cache_key
+        result = self._proba_cache_val
+        self._proba_cache_key = None
+        self._proba_cache_val = None
+        key = self._proba_key(X)
+        if (
+            cached is not None
+            and cached[0] is key[0]
+            and cached[1] is key[1]
+            and cached[2:] == key[2:]
+        ):
+            return result
+        return compute(self._prepare_X(X))
+
+    def _proba_key(self, X: np.ndarray | Any) -> tuple:
+        """Cache key for the model output on X."""
+        return (
+            self.model,
+            X,
+            getattr(X, "shape", None),
+            getattr(getattr(X, "dtype", None), "str", None),
+        )
+
+    def clear_cache(self) -> None:
+        """
+        Drop the model output kept between predict and predict_proba.
+
+        Call this when updating a Booster in place or modifying X in place
+        between predict(X) and predict_proba(X).
+        """
+        self._proba_cache_key = None
+        self._proba_cache_val = None
+
+    def _prepare_X(self, X: np.ndarray | Any) -> np.ndarray | Any:
+        """
+        Convert a NumPy input to the layout the backend reads without copying.
+
+        Non-array inputs (DataFrames, DMatrix, ...) are returned unchanged.
+
+        Args:
+            X: Input features
+
+        Returns:
+            Converted array, or X itself
+        """
+        if not isinstance(X, np.ndarray):
+            return X
+        return self._convert_array(X)
+
+    def _convert_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Backend-specific array conversion used by _prepare_X.
+
+        Args:
+            X: Input features as a NumPy array
+
+        Returns:
+            Array in the backend's preferred layout (X itself by default)
+        """
+        return X
 
     def _validate_model(self) -> None:
         """
@@ -47,7 +201,7 @@ class BaseModelAdapter(ABC):
         """
         if not hasattr(self.model, "predict"):
             raise ValueError(
-                f"Model {type(self.model).__name__} must have a 'predict' method"
+                f"Model {self._model_class_name} must {self._model_requirement}"
             )
 
     @abstractmethod
@@ -79,16 +233,6 @@ class BaseModelAdapter(ABC):
         """
         return None
 
-    @property
-    def supports_proba(self) -> bool:
-        """
-        Check if model supports probability predictions.
-
-        Returns:
-            True if predict_proba is available
-        """
-        return hasattr(self.model, "predict_proba")
-
     @property
     def model_type(self) -> str:
         """
@@ -97,4 +241,4 @@ class BaseModelAdapter(ABC):
         Returns:
             String identifying the model type
         """
-        return type(self.model).__name__
+        return self._model_class_name
@@ -4,11 +4,17 @@ LightGBM model adapter.
 This module provides an adapter for LightGBM models to work with JusticeAI.
 """
 
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
 
-from justiceai.core.adapters.base_adapter import BaseModelAdapter
+from justiceai.core.adapters.base_adapter import (
+    BaseModelAdapter,
+    _as_ndarray,
+    _binarize,
+    _positive_column_if_binary,
+)
 
 
 class LightGBMAdapter(BaseModelAdapter):
@@ -36,39 +42,58 @@ class LightGBMAdapter(BaseModelAdapter):
         >>> probabilities = adapter.predict_proba(X_test)
     """
 
-    def __init__(self, model: Any):
+    _model_requirement = (
+        "be a LightGBM model (LGBMClassifier or Booster) with a 'predict' method"
+    )
+
+    def __init__(
+        self, model: Any, batch_size: int | None = 65536, **predict_kwargs: Any
+    ):
         """
         Initialize LightGBM adapter.
 
         Args:
             model: LightGBM model instance (LGBMClassifier or Booster)
+            batch_size: Maximum rows per model call; larger inputs are
+                predicted in chunks to bound peak memory. None disables
+                batching.
+            **predict_kwargs: Extra keyword arguments forwarded to every
+                model predict call (e.g. ``num_threads=4`` or
+                ``pred_early_stop=True``)
 
         Raises:
             ValueError: If model is not a valid LightGBM model
         """
         super().__init__(model)
+        self.batch_size = batch_size
+        self.predict_kwargs = predict_kwargs
 
-    def _validate_model(self) -> None:
-        """
-        Validate that model is a valid LightGBM model.
-
-        Raises:
-            ValueError: If model doesn't have required LightGBM methods
+    def _predict_batched(
+        self, predict_fn: Callable[..., np.ndarray], X: np.ndarray | Any
+    ) -> np.ndarray:
         """
-        model_class = type(self.model).__name__
-
-        # Check if it's LGBMClassifier (has predict method)
-        if hasattr(self.model, "predict"):
-            return
+        Call predict_fn on X in chunks of at most batch_size rows.
 
-        # Check if it's Booster (has predict method)
-        if model_class == "Booster" and hasattr(self.model, "predict"):
-            return
+        Args:
+            predict_fn: Model predict method
+            X: Features to predict on (numpy array or pandas DataFrame)
 
-        raise ValueError(
-            f"Model {model_class} must be a LightGBM model "
-            f"(LGBMClassifier or Booster) with a 'predict' method"
-        )
+        Returns:
+            Predictions for all rows of X
+        """
+        n_rows = getattr(X, "shape", (0,))[0]
+        batch_size = self.batch_size
+        if batch_size is None or n_rows <= batch_size:
+            return _as_ndarray(predict_fn(X, **self.predict_kwargs))
+
+        rows = X.iloc if hasattr(X, "iloc") else X
+        first = _as_ndarray(predict_fn(rows[:batch_size], **self.predict_kwargs))
+        out = np.empty((n_rows,) + first.shape[1:], dtype=first.dtype)
+        out[:batch_size] = first
+        for start in range(batch_size, n_rows, batch_size):
+            stop = start + batch_size
+            out[start:stop] = predict_fn(rows[start:stop], **self.predict_kwargs)
+        return out
 
     def predict(self, X: np.ndarray | Any) -> np.ndarray:
         """
@@ -85,31 +110,7 @@ class LightGBMAdapter(BaseModelAdapter):
             >>> predictions
             array([0, 1, 1, 0, 1])
         """
-        model_class = type(self.model).__name__
-
-        # Handle LGBMClassifier
-        if model_class == "LGBMClassifier":
-            predictions = self.model.predict(X)
-            return np.asarray(predictions)
-
-        # Handle Booster
-        if model_class == "Booster":
-            # Booster.predict returns probabilities by default
-            probas = self.model.predict(X)
-
-            # Handle multi-dimensional output
-            if len(probas.shape) == 2:
-                # Multi-class: use argmax
-                predictions = np.argmax(probas, axis=1)
-            else:
-                # Binary: threshold at 0.5
-                predictions = (probas > 0.5).astype(int)
-
-            return predictions
-
-        # Fallback to direct predict
-        predictions = self.model.predict(X)
-        return np.asarray(predictions)
+        return self._predict_fn(X)
 
     def predict_proba(self, X: np.ndarray | Any) -> np.ndarray | None:
         """
@@ -127,35 +128,80 @@ class LightGBMAdapter(BaseModelAdapter):
             >>> probabilities
             array([0.23, 0.87, 0.65, 0.12, 0.91])
         """
-        if not self.supports_proba:
+        if self._predict_proba_fn is None:
             return None
+        return self._predict_proba_fn(X)
 
-        model_class = type(self.model).__name__
-
-        # Handle LGBMClassifier
-        if hasattr(self.model, "predict_proba"):
-            proba = self.model.predict_proba(X)
-            # Return probability of positive class for binary classification
-            if len(proba.shape) == 2 and proba.shape[1] == 2:
-                return proba[:, 1]
-            return proba
-
-        # Handle Booster
-        if model_class == "Booster":
-            probas = self.model.predict(X)
-
-            # Handle multi-dimensional output
-            if len(probas.shape) == 2 and probas.shape[1] == 2:
-                # Binary classification: return positive class
-                return probas[:, 1]
+    def _bind_predictors(self) -> None:
+        """Choose the predict/predict_proba implementations for the model."""
+        if self._model_class_name == "LGBMClassifier":
+            self._predict_fn = self._predict_classifier
+        elif self._is_booster:
+            self._predict_fn = self._predict_booster_labels
+        else:
+            self._predict_fn = self._predict_generic
 
-            # Already probabilities
-            return probas
+        if not self.supports_proba:
+            self._predict_proba_fn = None
+        elif self._has_predict_proba:
+            self._predict_proba_fn = self._predict_proba_classifier
+        else:
+            self._predict_proba_fn = self._predict_proba_booster
+
+    def _predict_classifier(self, X: np.ndarray | Any) -> np.ndarray:
+        """Labels from LGBMClassifier.predict."""
+        return self._predict_batched(self.model.predict, self._prepare_X(X))
+
+    def _predict_booster_labels(self, X: np.ndarray | Any) -> np.ndarray:
+        """Labels from Booster probabilities (argmax or 0.5 threshold)."""
+        # Booster.predict returns probabilities by default
+        probas = self._remember_proba(X, self._predict_booster)
+
+        # Handle multi-dimensional output
+        if len(probas.shape) == 2:
+            # Multi-class: use argmax
+            return np.argmax(probas, axis=1)
+
+        # Binary: threshold at 0.5
+        return _binarize(probas)
+
+    def _predict_generic(self, X: np.ndarray | Any) -> np.ndarray:
+        """Fallback to the model's own predict."""
+        predictions = self.model.predict(self._prepare_X(X))
+        return _as_ndarray(predictions)
+
+    def _predict_proba_classifier(self, X: np.ndarray | Any) -> np.ndarray:
+        """Probabilities from LGBMClassifier.predict_proba."""
+        proba = self._predict_proba_batched(self._prepare_X(X))
+        # Return probability of positive class for binary classification
+        return _positive_column_if_binary(proba)
+
+    def _predict_proba_booster(self, X: np.ndarray | Any) -> np.ndarray:
+        """Probabilities from Booster.predict."""
+        probas = self._recall_proba(X, self._predict_booster)
+        # Positive class of a 2-column output, otherwise already probabilities
+        return _positive_column_if_binary(probas)
+
+    def _predict_booster(self, X: np.ndarray | Any) -> np.ndarray:
+        """Run Booster.predict on X in batches."""
+        return self._predict_batched(self.model.predict, X)
+
+    def _predict_proba_batched(self, X: np.ndarray | Any) -> np.ndarray:
+        """Run LGBMClassifier.predict_proba on X in batches."""
+        return self._predict_batched(self.model.predict_proba, X)
+
+    def _convert_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Make sliced arrays contiguous; C- or F-contiguous ones pass through.
 
-        return None
+        LightGBM reads both row- and column-major buffers directly, so
+        only non-contiguous views need a copy.
+        """
+        if X.flags.c_contiguous or X.flags.f_contiguous:
+            return X
+        return np.ascontiguousarray(X)
 
-    @property
-    def supports_proba(self) -> bool:
+    def _check_supports_proba(self) -> bool:
         """
         Check if model supports probability predictions.
 
@@ -167,11 +213,8 @@ class LightGBMAdapter(BaseModelAdapter):
             for classification tasks.
         """
         # LGBMClassifier always supports probabilities
-        if hasattr(self.model, "predict_proba"):
+        if self._has_predict_proba:
             return True
 
         # Booster supports probabilities for classification
-        if type(self.model).__name__ == "Booster":
-            return True
-
-        return False
+        return self._is_booster
@@ -5,11 +5,83 @@ This module provides automatic detection and instantiation of the
 appropriate adapter for a given model.
 """
 
+import importlib
 from typing import Any
 
 from justiceai.core.adapters.base_adapter import BaseModelAdapter
 from justiceai.core.adapters.sklearn_adapter import SklearnAdapter
 
+# Dispatch rules, first match wins: (module substring, class-name prefix,
+# adapter module, adapter class, pip package). The gradient boosting
+# rules come first because their sklearn wrappers live in modules such
+# as ``xgboost.sklearn``.
+_RULES: tuple[tuple[str, str | None, str, str, str], ...] = (
+    (
+        "xgboost",
+        "XGB",
+        "justiceai.core.adapters.xgboost_adapter",
+        "XGBoostAdapter",
+        "xgboost",
+    ),
+    (
+        "lightgbm",
+        "LGBM",
+        "justiceai.core.adapters.lightgbm_adapter",
+        "LightGBMAdapter",
+        "lightgbm",
+    ),
+    (
+        "sklearn",
+        None,
+        "justiceai.core.adapters.sklearn_adapter",
+        "SklearnAdapter",
+        "scikit-learn",
+    ),
+)
+
+# Adapter class resolved per model type (None: no framework rule matched)
+_ADAPTER_CACHE: dict[type, type[BaseModelAdapter] | None] = {}
+
+
+def _adapter_class(model_type: type) -> type[BaseModelAdapter] | None:
+    """
+    Resolve the adapter class for a model type, memoized per type.
+
+    Args:
+        model_type: Class of the model
+
+    Returns:
+        Adapter class, or None if no framework rule matches
+
+    Raises:
+        ValueError: If the matching adapter cannot be imported
+    """
+    try:
+        return _ADAPTER_CACHE[model_type]
+    except KeyError:
+        pass
+
+    adapter_cls = None
+    module = model_type.__module__
+    class_name = model_type.__name__
+    for module_key, class_prefix, adapter_module, adapter_name, package in _RULES:
+        if module_key in module or (
+            class_prefix is not None and class_name.startswith(class_prefix)
+        ):
+            try:
+                adapter_cls = getattr(
+                    importlib.import_module(adapter_module), adapter_name
+                )
+            except ImportError:
+                raise ValueError(
+                    f"{adapter_name} requires {package} to be installed. "
+                    f"Install with: pip install {package}"
+                )
+            break
+
+    _ADAPTER_CACHE[model_type] = adapter_cls
+    return adapter_cls
+
 
 def create_adapter(model: Any) -> BaseModelAdapter:
     """
@@ -36,36 +108,9 @@ def create_adapter(model: Any) -> BaseModelAdapter:
         >>> adapter = create_adapter(model)  # Auto-detects sklearn
         >>> predictions = adapter.predict(X_test)
     """
-    model_class_name = type(model).__name__
-    model_module = type(model).__module__
-
-    # Check if it's a scikit-learn model
-    if "sklearn" in model_module:
-        return SklearnAdapter(model)
-
-    # Check if it's XGBoost
-    if "xgboost" in model_module or model_class_name.startswith("XGB"):
-        try:
-            from justiceai.core.adapters.xgboost_adapter import XGBoostAdapter
-
-            return XGBoostAdapter(model)
-        except ImportError:
-            raise ValueError(
-                "XGBoost adapter requires xgboost to be installed. "
-                "Install with: pip install xgboost"
-            )
-
-    # Check if it's LightGBM
-    if "lightgbm" in model_module or model_class_name.startswith("LGBM"):
-        try:
-            from justiceai.core.adapters.lightgbm_adapter import LightGBMAdapter
-
-            return LightGBMAdapter(model)
-        except ImportError:
-            raise ValueError(
-                "LightGBM adapter requires lightgbm to be installed. "
-                "Install with: pip install lightgbm"
-            )
+    adapter_cls = _adapter_class(type(model))
+    if adapter_cls is not None:
+        return adapter_cls(model)
 
     # If model has predict method, try sklearn adapter as fallback
     if hasattr(model, "predict"):
@@ -73,7 +118,8 @@ def create_adapter(model: Any) -> BaseModelAdapter:
 
     # Model type not supported
     raise ValueError(
-        f"Unsupported model type: {model_class_name} from {model_module}. "
+        f"Unsupported model type: {type(model).__name__} "
+        f"from {type(model).__module__}. "
         f"Supported frameworks: scikit-learn, XGBoost, LightGBM. "
         f"Model must have a 'predict' method."
     )
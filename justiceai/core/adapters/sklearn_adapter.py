@@ -8,7 +8,11 @@ from typing import Any
 
 import numpy as np
 
-from justiceai.core.adapters.base_adapter import BaseModelAdapter
+from justiceai.core.adapters.base_adapter import (
+    BaseModelAdapter,
+    _as_ndarray,
+    _positive_column_if_binary,
+)
 
 
 class SklearnAdapter(BaseModelAdapter):
@@ -41,7 +45,7 @@ class SklearnAdapter(BaseModelAdapter):
             Predicted labels as numpy array
         """
         predictions = self.model.predict(X)
-        return np.asarray(predictions)
+        return _as_ndarray(predictions)
 
     def predict_proba(self, X: np.ndarray | Any) -> np.ndarray | None:
         """
@@ -61,6 +65,4 @@ class SklearnAdapter(BaseModelAdapter):
 
         proba = self.model.predict_proba(X)
         # Return probabilities for positive class
-        if proba.shape[1] == 2:
-            return proba[:, 1]
-        return proba
+        return _positive_column_if_binary(proba)
@@ -8,7 +8,12 @@ from typing import Any
 
 import numpy as np
 
-from justiceai.core.adapters.base_adapter import BaseModelAdapter
+from justiceai.core.adapters.base_adapter import (
+    BaseModelAdapter,
+    _as_ndarray,
+    _binarize,
+    _positive_column_if_binary,
+)
 
 
 class XGBoostAdapter(BaseModelAdapter):
@@ -36,39 +41,9 @@ class XGBoostAdapter(BaseModelAdapter):
         >>> probabilities = adapter.predict_proba(X_test)
     """
 
-    def __init__(self, model: Any):
-        """
-        Initialize XGBoost adapter.
-
-        Args:
-            model: XGBoost model instance (XGBClassifier or Booster)
-
-        Raises:
-            ValueError: If model is not a valid XGBoost model
-        """
-        super().__init__(model)
-
-    def _validate_model(self) -> None:
-        """
-        Validate that model is a valid XGBoost model.
-
-        Raises:
-            ValueError: If model doesn't have required XGBoost methods
-        """
-        model_class = type(self.model).__name__
-
-        # Check if it's XGBClassifier (has predict method)
-        if hasattr(self.model, "predict"):
-            return
-
-        # Check if it's Booster (has predict method with different signature)
-        if model_class == "Booster" and hasattr(self.model, "predict"):
-            return
-
-        raise ValueError(
-            f"Model {model_class} must be an XGBoost model "
-            f"(XGBClassifier or Booster) with a 'predict' method"
-        )
+    _model_requirement = (
+        "be an XGBoost model (XGBClassifier or Booster) with a 'predict' method"
+    )
 
     def predict(self, X: np.ndarray | Any) -> np.ndarray:
         """
@@ -85,28 +60,7 @@ class XGBoostAdapter(BaseModelAdapter):
             >>> predictions
             array([0, 1, 1, 0, 1])
         """
-        # Handle XGBClassifier
-        if hasattr(self.model, "predict"):
-            predictions = self.model.predict(X)
-            return np.asarray(predictions)
-
-        # Handle Booster - need DMatrix
-        try:
-            import xgboost as xgb
-
-            if not isinstance(X, xgb.DMatrix):
-                X = xgb.DMatrix(X)
-
-            # Booster.predict returns probabilities
-            probas = self.model.predict(X)
-            # Convert to binary predictions
-            predictions = (probas > 0.5).astype(int)
-            return predictions
-        except ImportError:
-            raise ImportError(
-                "xgboost is required to use XGBoostAdapter. "
-                "Install with: pip install xgboost"
-            )
+        return self._predict_fn(X)
 
     def predict_proba(self, X: np.ndarray | Any) -> np.ndarray | None:
         """
@@ -124,35 +78,95 @@ class XGBoostAdapter(BaseModelAdapter):
             >>> probabilities
             array([0.23, 0.87, 0.65, 0.12, 0.91])
         """
-        if not self.supports_proba:
+        if self._predict_proba_fn is None:
             return None
+        return self._predict_proba_fn(X)
+
+    def _bind_predictors(self) -> None:
+        """Choose the predict/predict_proba implementations for the model."""
+        # Booster.predict needs a DMatrix, so Boosters get their own path
+        if self._is_booster:
+            self._booster_predict = (
+                self._booster_inplace_predict
+                if hasattr(self.model, "inplace_predict")
+                else self._booster_dmatrix_predict
+            )
+            self._predict_fn = self._predict_booster_labels
+        else:
+            self._predict_fn = self._predict_sklearn_api
 
-        # Handle XGBClassifier
-        if hasattr(self.model, "predict_proba"):
-            proba = self.model.predict_proba(X)
-            # Return probability of positive class
-            if proba.shape[1] == 2:
-                return proba[:, 1]
-            return proba
+        if not self.supports_proba:
+            self._predict_proba_fn = None
+        elif self._has_predict_proba:
+            self._predict_proba_fn = self._predict_proba_sklearn_api
+        else:
+            self._predict_proba_fn = self._predict_proba_booster
+
+    def _predict_sklearn_api(self, X: np.ndarray | Any) -> np.ndarray:
+        """Labels from XGBClassifier.predict."""
+        predictions = self.model.predict(self._prepare_X(X))
+        return _as_ndarray(predictions)
+
+    def _predict_booster_labels(self, X: np.ndarray | Any) -> np.ndarray:
+        """Labels from Booster probabilities thresholded at 0.5."""
+        probas = self._remember_proba(X, self._booster_predict)
+        return _binarize(probas)
+
+    def _predict_proba_sklearn_api(self, X: np.ndarray | Any) -> np.ndarray:
+        """Probabilities from XGBClassifier.predict_proba."""
+        proba = self.model.predict_proba(self._prepare_X(X))
+        # Return probability of positive class
+        return _positive_column_if_binary(proba)
+
+    def _predict_proba_booster(self, X: np.ndarray | Any) -> np.ndarray:
+        """Probabilities from Booster.predict (binary:logistic)."""
+        return self._recall_proba(X, self._booster_predict)
+
+    def _booster_inplace_predict(self, X: np.ndarray | Any) -> np.ndarray:
+        """
+        Run a Booster with ``inplace_predict``, skipping the DMatrix.
 
-        # Handle Booster
-        try:
-            import xgboost as xgb
+        Args:
+            X: Features to predict on (already converted by _prepare_X)
+
+        Returns:
+            Raw Booster output (probabilities for binary:logistic)
+        """
+        if isinstance(X, np.ndarray):
+            return self.model.inplace_predict(X)
+        return self._booster_dmatrix_predict(X)
+
+    def _booster_dmatrix_predict(self, X: np.ndarray | Any) -> np.ndarray:
+        """
+        Run a Booster on X, wrapping it in a DMatrix if needed.
 
-            if not isinstance(X, xgb.DMatrix):
-                X = xgb.DMatrix(X)
+        Args:
+            X: Features to predict on (numpy array or xgboost.DMatrix)
 
-            # Booster.predict returns probabilities directly
-            probas = self.model.predict(X)
-            return probas
+        Returns:
+            Raw Booster output (probabilities for binary:logistic)
+        """
+        try:
+            import xgboost as xgb
         except ImportError:
             raise ImportError(
                 "xgboost is required to use XGBoostAdapter. "
                 "Install with: pip install xgboost"
             )
 
-    @property
-    def supports_proba(self) -> bool:
+        if not isinstance(X, xgb.DMatrix):
+            X = xgb.DMatrix(X)
+        return self.model.predict(X)
+
+    def _convert_array(self, X: np.ndarray) -> np.ndarray:
+        """
+        Convert to a C-contiguous float32 array.
+
+        This is the layout XGBoost consumes without an internal copy.
+        """
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    def _check_supports_proba(self) -> bool:
         """
         Check if model supports probability predictions.
 
@@ -164,12 +178,9 @@ class XGBoostAdapter(BaseModelAdapter):
             support probability predictions.
         """
         # XGBClassifier always supports probabilities
-        if hasattr(self.model, "predict_proba"):
+        if self._has_predict_proba:
             return True
 
         # Booster supports probabilities if objective is binary:logistic
-        if type(self.model).__name__ == "Booster":
-            # Assume Booster supports probabilities (most common case)
-            return True
-
-        return False
+        # (assumed, as it is the most common case)
+        return self._is_booster
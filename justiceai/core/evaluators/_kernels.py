@@ -0,0 +1,38 @@
+"""
+Numeric kernels for threshold analysis.
+"""
+
+import numpy as np
+
+
+def group_confusion_counts(
+    y_sorted: np.ndarray, codes_sorted: np.ndarray, cut: np.ndarray, n_groups: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group TP/FP counts at each cut point of the score-sorted samples.
+
+    Args:
+        y_sorted: Positive-label mask in descending score order
+        codes_sorted: Integer group code of each sorted sample
+        cut: Number of leading samples predicted positive at each threshold
+        n_groups: Number of groups
+
+    Returns:
+        Tuple of (tp, fp, positives, negatives): TP/FP counts of shape
+        (n_thresholds, n_groups) among the first cut[t] samples, and the
+        per-group totals of positive and negative labels
+    """
+    is_pos = y_sorted.astype(bool)
+    tp = np.empty((len(cut), n_groups), dtype=np.int64)
+    fp = np.empty((len(cut), n_groups), dtype=np.int64)
+    positives = np.empty(n_groups, dtype=np.int64)
+    negatives = np.empty(n_groups, dtype=np.int64)
+    for g in range(n_groups):
+        in_group = codes_sorted == g
+        tps = np.concatenate(([0], np.cumsum(is_pos & in_group)))
+        fps = np.concatenate(([0], np.cumsum(~is_pos & in_group)))
+        tp[:, g] = tps[cut]
+        fp[:, g] = fps[cut]
+        positives[g] = tps[-1]
+        negatives[g] = fps[-1]
+    return tp, fp, positives, negatives
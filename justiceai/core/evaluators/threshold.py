@@ -5,18 +5,19 @@ This module provides tools to analyze how different decision thresholds
 affect both model performance and fairness metrics.
 """
 
-from typing import Any, Callable, Optional
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 
-from justiceai.core.metrics.posttrain import (
-    disparate_impact,
-    equal_opportunity,
-    equalized_odds,
-    statistical_parity,
-)
+from justiceai.core.evaluators._kernels import group_confusion_counts
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise division returning 0 where the denominator is 0."""
+    out = np.zeros(np.shape(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
 
 
 class ThresholdAnalyzer:
@@ -60,14 +61,14 @@ class ThresholdAnalyzer:
         Initialize threshold analyzer.
 
         Args:
-            thresholds: Array of thresholds to test (default: 0.01 to 0.99)
+            thresholds: Array of thresholds to test (default: 0.01 to 0.99).
+                They are compared against the scores in the scores' own
+                precision (float32 scores stay float32, others use float64).
             fairness_metrics: List of fairness metrics to compute
             performance_metrics: List of performance metrics to compute
         """
         self.thresholds = (
-            thresholds
-            if thresholds is not None
-            else np.linspace(0.01, 0.99, 99)
+            thresholds if thresholds is not None else np.linspace(0.01, 0.99, 99)
         )
 
         self.fairness_metrics = fairness_metrics or [
@@ -87,6 +88,16 @@ class ThresholdAnalyzer:
         self.results_: Optional[pd.DataFrame] = None
         self.optimal_threshold_: Optional[float] = None
 
+        # Normalized (performance, fairness) columns per metric pair, valid
+        # for the results_ frame they were computed from
+        self._norm_cache: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]] = {}
+        self._norm_cache_results: Optional[pd.DataFrame] = None
+
+        # Score-sorted inputs of the last analyze() call, keyed by the
+        # identity of the (y_true, y_pred_proba, sensitive_attr) objects
+        self._sorted_cache_key: Optional[tuple] = None
+        self._sorted_cache: Optional[tuple] = None
+
     def analyze(
         self,
         y_true: np.ndarray,
@@ -104,60 +115,136 @@ class ThresholdAnalyzer:
         Returns:
             DataFrame with metrics for each threshold
 
+        Note:
+            The sorted inputs are reused when analyze() is called again
+            with the same array objects (e.g. after changing thresholds),
+            so pass new arrays rather than modifying them in place.
+
         Example:
             >>> analyzer = ThresholdAnalyzer()
             >>> results = analyzer.analyze(y_true, y_proba, sensitive)
             >>> print(results.head())
         """
-        results = []
+        self._norm_cache.clear()
+
+        thresholds = np.asarray(self.thresholds)
+        neg_scores, y_sorted, codes_sorted, n_groups = self._sorted_inputs(
+            y_true, y_pred_proba, sensitive_attr
+        )
 
-        for threshold in self.thresholds:
-            # Convert probabilities to binary predictions
-            y_pred = (y_pred_proba >= threshold).astype(int)
+        # Number of samples with score >= threshold, compared in the
+        # precision of the scores so no score changes side of a threshold
+        cut = np.searchsorted(
+            neg_scores, -thresholds.astype(neg_scores.dtype, copy=False), side="right"
+        )
+        group_tp, group_fp, group_pos, group_neg = group_confusion_counts(
+            y_sorted, codes_sorted, cut, n_groups
+        )
+
+        # Performance metrics from the totals over groups
+        tp = group_tp.sum(axis=1)
+        fp = group_fp.sum(axis=1)
+        fn = group_pos.sum() - tp
+        tn = group_neg.sum() - fp
+
+        # One freshly allocated array per column, so the frame below can
+        # adopt them without copying (or aliasing self.thresholds)
+        columns: dict[str, np.ndarray] = {"threshold": thresholds.copy()}
 
-            metrics = {"threshold": threshold}
+        if "accuracy" in self.performance_metrics:
+            columns["accuracy"] = (tp + tn) / len(y_sorted)
 
-            # Calculate performance metrics
-            if "accuracy" in self.performance_metrics:
-                metrics["accuracy"] = accuracy_score(y_true, y_pred)
+        if "precision" in self.performance_metrics:
+            columns["precision"] = _safe_divide(tp, tp + fp)
 
-            if "precision" in self.performance_metrics:
-                metrics["precision"] = precision_score(
-                    y_true, y_pred, zero_division=0.0
-                )
+        if "recall" in self.performance_metrics:
+            columns["recall"] = _safe_divide(tp, tp + fn)
 
-            if "recall" in self.performance_metrics:
-                metrics["recall"] = recall_score(
-                    y_true, y_pred, zero_division=0.0
-                )
+        if "f1_score" in self.performance_metrics:
+            columns["f1_score"] = _safe_divide(2 * tp, 2 * tp + fp + fn)
 
-            if "f1_score" in self.performance_metrics:
-                metrics["f1_score"] = f1_score(y_true, y_pred, zero_division=0.0)
+        # Fairness metrics from the per-group counts (threshold x group
+        # arrays, no per-threshold metric calls)
+        if {"statistical_parity", "disparate_impact"} & set(self.fairness_metrics):
+            selection = (group_tp + group_fp) / (group_pos + group_neg)
+            sel_max = selection.max(axis=1)
+            sel_min = selection.min(axis=1)
+            sel_ratio = np.ones(len(thresholds))
+            np.divide(sel_min, sel_max, out=sel_ratio, where=sel_max > 0)
 
-            # Calculate fairness metrics
-            if "statistical_parity" in self.fairness_metrics:
-                sp_result = statistical_parity(y_pred, sensitive_attr)
-                metrics["statistical_parity_diff"] = sp_result["difference"]
-                metrics["statistical_parity_ratio"] = sp_result["ratio"]
+        if {"equal_opportunity", "equalized_odds"} & set(self.fairness_metrics):
+            tpr = _safe_divide(group_tp, group_pos)
+            tpr_diff = tpr.max(axis=1) - tpr.min(axis=1)
 
-            if "disparate_impact" in self.fairness_metrics:
-                di_result = disparate_impact(y_pred, sensitive_attr)
-                metrics["disparate_impact_ratio"] = di_result["ratio"]
+        if "statistical_parity" in self.fairness_metrics:
+            columns["statistical_parity_diff"] = sel_max - sel_min
+            columns["statistical_parity_ratio"] = sel_ratio
 
-            if "equal_opportunity" in self.fairness_metrics:
-                eo_result = equal_opportunity(y_true, y_pred, sensitive_attr)
-                metrics["equal_opportunity_diff"] = eo_result["difference"]
+        if "disparate_impact" in self.fairness_metrics:
+            columns["disparate_impact_ratio"] = sel_ratio.copy()
 
-            if "equalized_odds" in self.fairness_metrics:
-                eq_result = equalized_odds(y_true, y_pred, sensitive_attr)
-                metrics["equalized_odds_tpr_diff"] = eq_result["tpr_difference"]
-                metrics["equalized_odds_fpr_diff"] = eq_result["fpr_difference"]
+        if "equal_opportunity" in self.fairness_metrics:
+            columns["equal_opportunity_diff"] = tpr_diff
 
-            results.append(metrics)
+        if "equalized_odds" in self.fairness_metrics:
+            fpr = _safe_divide(group_fp, group_neg)
+            columns["equalized_odds_tpr_diff"] = tpr_diff.copy()
+            columns["equalized_odds_fpr_diff"] = fpr.max(axis=1) - fpr.min(axis=1)
 
-        self.results_ = pd.DataFrame(results)
+        self.results_ = pd.DataFrame(columns, copy=False)
         return self.results_
 
+    def _sorted_inputs(
+        self,
+        y_true: np.ndarray,
+        y_pred_proba: np.ndarray,
+        sensitive_attr: pd.Series,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """
+        Sort the samples by descending score, reusing the last sort.
+
+        The confusion counts at each threshold are then read at cut points
+        of the sorted order, as sklearn's precision_recall_curve does.
+
+        Args:
+            y_true: True labels
+            y_pred_proba: Predicted probabilities
+            sensitive_attr: Sensitive attribute
+
+        Returns:
+            Tuple of (negated sorted scores, positive-label mask, group
+            codes, number of groups), all in descending score order
+        """
+        key = (y_true, y_pred_proba, sensitive_attr)
+        cached_key = self._sorted_cache_key
+        if cached_key is not None and all(
+            a is b for a, b in zip(cached_key, key, strict=True)
+        ):
+            return self._sorted_cache
+
+        # float32 scores are sorted as they are; anything else as float64
+        y_pred_proba = np.asarray(y_pred_proba)
+        if y_pred_proba.dtype != np.float32:
+            y_pred_proba = y_pred_proba.astype(np.float64, copy=False)
+        order = np.argsort(-y_pred_proba, kind="stable")
+
+        # Integer group codes (sorted like the metric functions' groups),
+        # narrowed so the kernel reads fewer bytes per sample
+        group_codes, groups = pd.factorize(
+            np.asarray(sensitive_attr), sort=True, use_na_sentinel=False
+        )
+        if len(groups) < np.iinfo(np.int8).max:
+            group_codes = group_codes.astype(np.int8)
+
+        self._sorted_cache = (
+            -y_pred_proba[order],
+            np.asarray(y_true)[order] == 1,
+            group_codes[order],
+            len(groups),
+        )
+        self._sorted_cache_key = key
+        return self._sorted_cache
+
     def find_optimal_threshold(
         self,
         fairness_metric: str = "disparate_impact_ratio",
@@ -188,50 +275,42 @@ class ThresholdAnalyzer:
         if self.results_ is None:
             raise ValueError("Must call analyze() before finding optimal threshold")
 
-        df = self.results_.copy()
-
-        # Normalize metrics to [0, 1] range
-        if performance_metric in df.columns:
-            perf_normalized = df[performance_metric] / df[performance_metric].max()
-        else:
+        df = self.results_
+        if performance_metric not in df.columns:
             raise ValueError(f"Performance metric '{performance_metric}' not found")
-
-        if fairness_metric in df.columns:
-            # For metrics where higher is better (like disparate_impact_ratio)
-            if "ratio" in fairness_metric:
-                fair_normalized = df[fairness_metric] / df[fairness_metric].max()
-            # For metrics where lower is better (like difference metrics)
-            else:
-                fair_normalized = 1 - (
-                    df[fairness_metric] / df[fairness_metric].max()
-                )
-        else:
+        if fairness_metric not in df.columns:
             raise ValueError(f"Fairness metric '{fairness_metric}' not found")
 
-        # Apply fairness constraint if specified
+        # Check the fairness constraint before doing any scoring work
         if fairness_constraint is not None:
-            valid_mask = df[fairness_metric] >= fairness_constraint
-            df = df[valid_mask]
-            perf_normalized = perf_normalized[valid_mask]
-            fair_normalized = fair_normalized[valid_mask]
-
-            if len(df) == 0:
+            valid_mask = df[fairness_metric].to_numpy() >= fairness_constraint
+            if not valid_mask.any():
                 return {
                     "threshold": None,
                     "message": "No threshold satisfies the fairness constraint",
                     "fairness_constraint": fairness_constraint,
                 }
 
+        perf_normalized, fair_normalized = self._normalized_metrics(
+            fairness_metric, performance_metric
+        )
+
         # Calculate combined score
         combined_score = (
-            fairness_weight * fair_normalized
-            + (1 - fairness_weight) * perf_normalized
+            fairness_weight * fair_normalized + (1 - fairness_weight) * perf_normalized
         )
 
-        # Find optimal threshold
-        optimal_idx = combined_score.idxmax()
-        optimal_row = df.loc[optimal_idx]
+        # Find optimal threshold (positional, first maximum, NaN skipped),
+        # restricted to the rows meeting the constraint if specified
+        if fairness_constraint is not None:
+            valid_rows = np.flatnonzero(valid_mask)
+            optimal_pos = int(valid_rows[np.nanargmax(combined_score[valid_rows])])
+        else:
+            optimal_pos = int(np.nanargmax(combined_score))
 
+        optimal_row = {
+            column: df[column].to_numpy()[optimal_pos].item() for column in df.columns
+        }
         self.optimal_threshold_ = float(optimal_row["threshold"])
 
         return {
@@ -240,10 +319,53 @@ class ThresholdAnalyzer:
             "fairness_value": float(optimal_row[fairness_metric]),
             "performance_metric": performance_metric,
             "performance_value": float(optimal_row[performance_metric]),
-            "combined_score": float(combined_score.loc[optimal_idx]),
-            "all_metrics": optimal_row.to_dict(),
+            "combined_score": float(combined_score[optimal_pos]),
+            "all_metrics": optimal_row,
         }
 
+    def _normalized_metrics(
+        self, fairness_metric: str, performance_metric: str
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Normalize a performance and a fairness metric to the [0, 1] range.
+
+        Results are cached per metric pair until results_ changes, so
+        repeated find_optimal_threshold calls (e.g. with different
+        weights) reuse them.
+
+        Args:
+            fairness_metric: Name of fairness metric
+            performance_metric: Name of performance metric
+
+        Returns:
+            Tuple of (normalized performance, normalized fairness)
+        """
+        df = self.results_
+        if self._norm_cache_results is not df:
+            self._norm_cache.clear()
+            self._norm_cache_results = df
+
+        key = (fairness_metric, performance_metric)
+        cached = self._norm_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Normalize metrics to [0, 1] range
+        perf_normalized = (
+            df[performance_metric] / df[performance_metric].max()
+        ).to_numpy()
+
+        # For metrics where higher is better (like disparate_impact_ratio)
+        if "ratio" in fairness_metric:
+            fair_normalized = df[fairness_metric] / df[fairness_metric].max()
+        # For metrics where lower is better (like difference metrics)
+        else:
+            fair_normalized = 1 - (df[fairness_metric] / df[fairness_metric].max())
+        fair_normalized = fair_normalized.to_numpy()
+
+        self._norm_cache[key] = (perf_normalized, fair_normalized)
+        return perf_normalized, fair_normalized
+
     def plot_tradeoff_curve(
         self,
         fairness_metric: str = "disparate_impact_ratio",
@@ -295,9 +417,7 @@ class ThresholdAnalyzer:
 
         if use_case == "balanced":
             result = self.find_optimal_threshold(fairness_weight=0.5)
-            explanation = (
-                "Balanced approach: Equal weight to fairness and performance"
-            )
+            explanation = "Balanced approach: Equal weight to fairness and performance"
         elif use_case == "fairness_priority":
             result = self.find_optimal_threshold(fairness_weight=0.7)
             explanation = (
@@ -0,0 +1,39 @@
+"""
+Group factorization shared by the fairness metrics.
+
+Metrics work on integer group codes so per-group statistics reduce to
+``np.bincount`` calls instead of one equality scan per group.
+"""
+
+import numpy as np
+import pandas as pd
+
+# (codes, names): one integer code per row and the group name for each code
+Factorized = tuple[np.ndarray, list[str]]
+
+
+def factorize_groups(sensitive_attr: pd.Series) -> Factorized:
+    """
+    Encode a sensitive attribute as integer group codes.
+
+    Groups are numbered in order of first appearance (as with
+    ``Series.unique``); missing values form their own group. Categorical
+    input reuses its category codes instead of hashing the values again.
+
+    Args:
+        sensitive_attr: Sensitive attribute values
+
+    Returns:
+        Tuple of (codes, names) where names are ``str`` of each group value
+    """
+    if isinstance(getattr(sensitive_attr, "dtype", None), pd.CategoricalDtype):
+        # Renumber the existing category codes (cheap integer hashing);
+        # code -1 marks a missing value
+        codes, present = pd.factorize(sensitive_attr.cat.codes.to_numpy())
+        categories = sensitive_attr.cat.categories
+        return codes, [
+            str(categories[code]) if code >= 0 else "nan" for code in present
+        ]
+
+    codes, groups = pd.factorize(np.asarray(sensitive_attr), use_na_sentinel=False)
+    return codes, [str(group) for group in groups]
@@ -0,0 +1,50 @@
+"""
+Numeric kernels for post-training metrics.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+def _as_bits(values: np.ndarray) -> Optional[np.ndarray]:
+    """``values`` as uint8 0/1 without masking, or None if not all 0/1."""
+    if values.dtype.kind == "b":
+        return values.view(np.uint8)
+    if values.dtype.kind in "iu" and (
+        values.size == 0 or (values.min() >= 0 and values.max() <= 1)
+    ):
+        return values.astype(np.uint8, copy=False)
+    return None
+
+
+def group_confusion_counts(
+    y_true: np.ndarray, y_pred: np.ndarray, codes: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """
+    Confusion counts per group in one pass.
+
+    Args:
+        y_true: True labels
+        y_pred: Predictions
+        codes: Integer group code of each sample
+        n_groups: Number of groups
+
+    Returns:
+        Counts of shape (n_groups, 4) with columns TN, FP, FN, TP
+        (column = 2 * y_true + y_pred); samples whose label or prediction
+        is not 0/1 are skipped
+    """
+    true_bits = _as_bits(y_true)
+    pred_bits = _as_bits(y_pred)
+    if true_bits is None or pred_bits is None:
+        # Drop samples with a label or prediction other than 0/1
+        valid = ((y_true == 0) | (y_true == 1)) & ((y_pred == 0) | (y_pred == 1))
+        codes = codes[valid]
+        true_bits = (y_true[valid] == 1).view(np.uint8)
+        pred_bits = (y_pred[valid] == 1).view(np.uint8)
+
+    # One bincount over codes * 4 + (y_true << 1 | y_pred) fills every cell
+    state = (true_bits << 1) | pred_bits
+    flat = codes.astype(np.int64) * 4 + state
+    return np.bincount(flat, minlength=4 * n_groups).reshape(n_groups, 4)
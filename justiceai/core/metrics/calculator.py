@@ -5,23 +5,21 @@ This module provides a single interface to calculate all fairness metrics
 with caching and validation.
 """
 
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
+from justiceai.core.metrics._groups import Factorized, factorize_groups
+from justiceai.core.metrics._kernels import _as_bits
 from justiceai.core.metrics.posttrain import (
-    accuracy_difference,
+    _assemble_posttrain,
+    _compute_group_confusion,
+    _compute_group_confusion_batch,
     calibration_by_group,
-    confusion_matrix_by_group,
-    disparate_impact,
-    equal_opportunity,
-    equalized_odds,
-    false_negative_rate_difference,
-    negative_predictive_parity,
-    predictive_parity,
-    statistical_parity,
-    treatment_equality,
 )
 from justiceai.core.metrics.pretrain import (
     class_balance,
@@ -31,6 +29,83 @@ from justiceai.core.metrics.pretrain import (
     kl_divergence,
 )
 
+# Maximum number of content-addressed results kept per calculator
+_RESULT_CACHE_SIZE = 8
+
+# Basic fairness checks as (metric, pass flag); bit i of a violation mask is
+# set when check i fails
+_VIOLATION_CHECKS = (
+    ("statistical_parity", "is_fair"),
+    ("disparate_impact", "passes_80_rule"),
+    ("equal_opportunity", "is_fair"),
+    ("equalized_odds", "is_fair"),
+)
+
+
+def _violation_mask(posttrain: dict[str, Any]) -> int:
+    """Bitmask of the failed basic fairness checks (see _VIOLATION_CHECKS)."""
+    mask = 0
+    for bit, (metric, flag) in enumerate(_VIOLATION_CHECKS):
+        if not posttrain.get(metric, {}).get(flag, True):
+            mask |= 1 << bit
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class _SummaryFields:
+    """Scalars the summary and recommendations read from posttrain results."""
+
+    violation_mask: int
+    di_ratio: float
+    sp_diff: float
+
+    @classmethod
+    def from_posttrain(cls, posttrain: dict[str, Any]) -> "_SummaryFields":
+        """Extract the fields from a posttrain results dict."""
+        return cls(
+            violation_mask=_violation_mask(posttrain),
+            di_ratio=float(posttrain.get("disparate_impact", {}).get("ratio", 1.0)),
+            sp_diff=float(
+                posttrain.get("statistical_parity", {}).get("difference", 0.0)
+            ),
+        )
+
+
+def _compact_labels(values: np.ndarray) -> np.ndarray:
+    """
+    Binary labels/predictions as a contiguous uint8 array.
+
+    Bool and 0/1 integer input shrinks to one byte per sample (bool is
+    reinterpreted without copying); anything else, such as scores or
+    multi-class labels, is returned unchanged so the metrics keep their
+    semantics for it.
+    """
+    array = np.asarray(values)
+    bits = _as_bits(array)
+    return array if bits is None else np.ascontiguousarray(bits)
+
+
+def _fingerprint(*inputs: Any) -> str:
+    """Content hash of metric inputs (arrays, Series, DataFrames or None)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        digest.update(type(value).__name__.encode())
+        if value is None:
+            continue
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            if isinstance(value, pd.DataFrame):
+                digest.update(repr(list(value.columns)).encode())
+            hashed = pd.util.hash_pandas_object(value, index=False).to_numpy()
+            digest.update(hashed.tobytes())
+            continue
+        array = np.asarray(value)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        if array.dtype.hasobject:
+            digest.update(pd.util.hash_array(array.ravel()).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(array).view(np.uint8).tobytes())
+    return digest.hexdigest()
+
 
 class FairnessCalculator:
     """
@@ -73,8 +148,36 @@ class FairnessCalculator:
         """
         self.cache_results = cache_results
         self.cache: dict[str, Any] = {} if cache_results else {}
+        # Results by content key, least recently used first
+        self._results: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
         self._validated = False
 
+    def _cache_key(self, kind: str, *inputs: Any) -> Optional[tuple[str, str]]:
+        """Content-addressed cache key, or None when caching is disabled."""
+        if not self.cache_results:
+            return None
+        return kind, _fingerprint(*inputs)
+
+    def _lookup(
+        self, kind: str, key: Optional[tuple[str, str]]
+    ) -> Optional[dict[str, Any]]:
+        """Cached results for ``key`` (None on a miss), marked as latest."""
+        if key is None or key not in self._results:
+            return None
+        self._results.move_to_end(key)
+        self.cache[kind] = self._results[key]
+        return self.cache[kind]
+
+    def _store(
+        self, kind: str, key: Optional[tuple[str, str]], results: dict[str, Any]
+    ) -> None:
+        """Cache results under their key; ``cache[kind]`` holds the latest."""
+        if key is not None:
+            self._results[key] = results
+            if len(self._results) > _RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+            self.cache[kind] = results
+
     def _validate_inputs(
         self,
         y_true: Optional[np.ndarray] = None,
@@ -82,8 +185,14 @@ class FairnessCalculator:
         y_pred_proba: Optional[np.ndarray] = None,
         sensitive_attr: Optional[pd.Series] = None,
         X: Optional[pd.DataFrame] = None,
-    ) -> None:
-        """Validate input arrays."""
+    ) -> Optional[pd.Series]:
+        """
+        Validate input arrays.
+
+        Returns:
+            ``sensitive_attr`` as a categorical Series (None if not given), so
+            the metrics work from its integer codes
+        """
         if y_true is not None and y_pred is not None:
             if len(y_true) != len(y_pred):
                 raise ValueError("y_true and y_pred must have same length")
@@ -102,6 +211,12 @@ class FairnessCalculator:
 
         self._validated = True
 
+        if sensitive_attr is None or isinstance(
+            getattr(sensitive_attr, "dtype", None), pd.CategoricalDtype
+        ):
+            return sensitive_attr
+        return pd.Series(sensitive_attr, dtype="category")
+
     def calculate_pretrain_metrics(
         self, X: pd.DataFrame, y: pd.Series, sensitive_attr: pd.Series
     ) -> dict[str, Any]:
@@ -121,22 +236,40 @@ class FairnessCalculator:
             >>> metrics = calculator.calculate_pretrain_metrics(X, y, sensitive)
             >>> print(metrics['class_balance'])
         """
-        self._validate_inputs(y_true=y.values, sensitive_attr=sensitive_attr, X=X)
+        sensitive_attr = self._validate_inputs(
+            y_true=y.values, sensitive_attr=sensitive_attr, X=X
+        )
+        return self._pretrain_metrics(X, y, sensitive_attr)
 
-        cache_key = "pretrain"
-        if self.cache_results and cache_key in self.cache:
-            return self.cache[cache_key]
+    def _pretrain_metrics(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        sensitive_attr: pd.Series,
+        factorized: Optional[Factorized] = None,
+    ) -> dict[str, Any]:
+        """
+        Pre-training metrics for validated inputs.
+
+        ``factorized`` is the caller's ``factorize_groups`` result for
+        ``sensitive_attr``; it is computed here on a cache miss if omitted.
+        """
+        cache_key = self._cache_key("pretrain", X, y, sensitive_attr)
+        cached = self._lookup("pretrain", cache_key)
+        if cached is not None:
+            return cached
 
+        if factorized is None:
+            factorized = factorize_groups(sensitive_attr)
         results = {
-            "class_balance": class_balance(y, sensitive_attr),
+            "class_balance": class_balance(y, sensitive_attr, factorized),
             "concept_balance": concept_balance(X, y, sensitive_attr),
             "group_distribution_difference": group_distribution_difference(
-                y, sensitive_attr
+                y, sensitive_attr, factorized
             ),
         }
 
-        if self.cache_results:
-            self.cache[cache_key] = results
+        self._store("pretrain", cache_key, results)
 
         return results
 
@@ -166,46 +299,51 @@ class FairnessCalculator:
             ... )
             >>> print(metrics['statistical_parity'])
         """
-        self._validate_inputs(
+        sensitive_attr = self._validate_inputs(
             y_true=y_true,
             y_pred=y_pred,
             y_pred_proba=y_pred_proba,
             sensitive_attr=sensitive_attr,
         )
+        return self._posttrain_metrics(y_true, y_pred, sensitive_attr, y_pred_proba)
 
-        cache_key = "posttrain"
-        if self.cache_results and cache_key in self.cache:
-            return self.cache[cache_key]
+    def _posttrain_metrics(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        sensitive_attr: pd.Series,
+        y_pred_proba: Optional[np.ndarray] = None,
+        factorized: Optional[Factorized] = None,
+    ) -> dict[str, Any]:
+        """
+        Post-training metrics for validated inputs.
 
-        results = {
-            # Basic metrics
-            "statistical_parity": statistical_parity(y_pred, sensitive_attr),
-            "disparate_impact": disparate_impact(y_pred, sensitive_attr),
-            "equal_opportunity": equal_opportunity(y_true, y_pred, sensitive_attr),
-            "equalized_odds": equalized_odds(y_true, y_pred, sensitive_attr),
-            "confusion_matrix": confusion_matrix_by_group(
-                y_true, y_pred, sensitive_attr
-            ),
-            # Advanced metrics
-            "false_negative_rate_diff": false_negative_rate_difference(
-                y_true, y_pred, sensitive_attr
-            ),
-            "predictive_parity": predictive_parity(y_true, y_pred, sensitive_attr),
-            "negative_predictive_parity": negative_predictive_parity(
-                y_true, y_pred, sensitive_attr
-            ),
-            "accuracy_difference": accuracy_difference(y_true, y_pred, sensitive_attr),
-            "treatment_equality": treatment_equality(y_true, y_pred, sensitive_attr),
-        }
+        ``factorized`` is the caller's ``factorize_groups`` result for
+        ``sensitive_attr``; it is computed here on a cache miss if omitted.
+        """
+        y_true = _compact_labels(y_true)
+        y_pred = _compact_labels(y_pred)
+
+        cache_key = self._cache_key(
+            "posttrain", y_true, y_pred, sensitive_attr, y_pred_proba
+        )
+        cached = self._lookup("posttrain", cache_key)
+        if cached is not None:
+            return cached
+
+        # One pass over the data; every metric is derived from these counts
+        if factorized is None:
+            factorized = factorize_groups(sensitive_attr)
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr, factorized)
+        results = _assemble_posttrain(confusion)
 
         # Add calibration if probabilities provided
         if y_pred_proba is not None:
             results["calibration"] = calibration_by_group(
-                y_true, y_pred_proba, sensitive_attr
+                y_true, y_pred_proba, sensitive_attr, factorized=factorized
             )
 
-        if self.cache_results:
-            self.cache[cache_key] = results
+        self._store("posttrain", cache_key, results)
 
         return results
 
@@ -246,7 +384,7 @@ class FairnessCalculator:
             ... )
             >>> print(all_metrics['summary']['overall_fairness_score'])
         """
-        self._validate_inputs(
+        sensitive_attr = self._validate_inputs(
             y_true=y_true,
             y_pred=y_pred,
             y_pred_proba=y_pred_proba,
@@ -254,22 +392,20 @@ class FairnessCalculator:
             X=X,
         )
 
+        # Pre and post-training metrics share one factorization
+        factorized = factorize_groups(sensitive_attr)
+
         results: dict[str, Any] = {}
 
         # Calculate pre-training metrics if X provided
         if X is not None:
-            results["pretrain"] = self.calculate_pretrain_metrics(
-                X=X,
-                y=pd.Series(y_true),
-                sensitive_attr=sensitive_attr,
+            results["pretrain"] = self._pretrain_metrics(
+                X, pd.Series(y_true), sensitive_attr, factorized
             )
 
         # Calculate post-training metrics
-        results["posttrain"] = self.calculate_posttrain_metrics(
-            y_true=y_true,
-            y_pred=y_pred,
-            sensitive_attr=sensitive_attr,
-            y_pred_proba=y_pred_proba,
+        results["posttrain"] = self._posttrain_metrics(
+            y_true, y_pred, sensitive_attr, y_pred_proba, factorized
         )
 
         # Calculate summary statistics
@@ -277,6 +413,88 @@ class FairnessCalculator:
 
         return results
 
+    def calculate_all_batch(
+        self,
+        y_true: np.ndarray,
+        y_preds: np.ndarray,
+        sensitive_attr: pd.Series,
+        X: Optional[pd.DataFrame] = None,
+        y_pred_probas: Optional[np.ndarray] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Calculate all fairness metrics for several models on the same data.
+
+        Equivalent to calling ``calculate_all`` once per row of ``y_preds``
+        (e.g. candidate models in a sweep or bootstrap resamples), but the
+        sensitive attribute is factorized once, the confusion counts of all
+        models come from a single pass, and the pre-training metrics are
+        computed once and shared. Per-model results are not cached.
+
+        Args:
+            y_true: True labels
+            y_preds: Model predictions, shape (n_models, n_samples)
+            sensitive_attr: Sensitive attribute
+            X: Feature matrix (optional, for pre-training metrics)
+            y_pred_probas: Predicted probabilities, shape (n_models, n_samples)
+                (optional, for calibration)
+
+        Returns:
+            One ``calculate_all``-style dictionary per model
+
+        Example:
+            >>> calculator = FairnessCalculator()
+            >>> results = calculator.calculate_all_batch(
+            ...     y_true=y,
+            ...     y_preds=np.vstack([model.predict(X) for model in models]),
+            ...     sensitive_attr=sensitive,
+            ... )
+            >>> [r['summary']['overall_fairness_score'] for r in results]
+        """
+        y_preds = np.asarray(y_preds)
+        if y_preds.ndim != 2:
+            raise ValueError("y_preds must have shape (n_models, n_samples)")
+        if y_pred_probas is not None:
+            y_pred_probas = np.asarray(y_pred_probas)
+            if y_pred_probas.shape != y_preds.shape:
+                raise ValueError("y_pred_probas and y_preds must have same shape")
+
+        sensitive_attr = self._validate_inputs(
+            y_true=y_true,
+            y_pred=y_preds[0] if len(y_preds) else None,
+            sensitive_attr=sensitive_attr,
+            X=X,
+        )
+
+        factorized = factorize_groups(sensitive_attr)
+
+        pretrain = None
+        if X is not None:
+            pretrain = self._pretrain_metrics(
+                X, pd.Series(y_true), sensitive_attr, factorized
+            )
+
+        y_true = _compact_labels(y_true)
+        confusions = _compute_group_confusion_batch(
+            y_true, y_preds, sensitive_attr, factorized
+        )
+
+        batch = []
+        for k, confusion in enumerate(confusions):
+            posttrain = _assemble_posttrain(confusion)
+            if y_pred_probas is not None:
+                posttrain["calibration"] = calibration_by_group(
+                    y_true, y_pred_probas[k], sensitive_attr, factorized=factorized
+                )
+
+            results: dict[str, Any] = {}
+            if pretrain is not None:
+                results["pretrain"] = pretrain
+            results["posttrain"] = posttrain
+            results["summary"] = self._calculate_summary(results)
+            batch.append(results)
+
+        return batch
+
     def _calculate_summary(self, results: dict[str, Any]) -> dict[str, Any]:
         """
         Calculate summary statistics from all metrics.
@@ -287,34 +505,28 @@ class FairnessCalculator:
         Returns:
             Dictionary with summary statistics
         """
-        posttrain = results.get("posttrain", {})
+        fields = _SummaryFields.from_posttrain(results.get("posttrain", {}))
 
         # Count fairness violations
-        violations = []
-        if not posttrain.get("statistical_parity", {}).get("is_fair", True):
-            violations.append("statistical_parity")
-        if not posttrain.get("disparate_impact", {}).get("passes_80_rule", True):
-            violations.append("disparate_impact")
-        if not posttrain.get("equal_opportunity", {}).get("is_fair", True):
-            violations.append("equal_opportunity")
-        if not posttrain.get("equalized_odds", {}).get("is_fair", True):
-            violations.append("equalized_odds")
+        violation_mask = fields.violation_mask
+        violations = [
+            metric
+            for bit, (metric, _) in enumerate(_VIOLATION_CHECKS)
+            if violation_mask >> bit & 1
+        ]
 
         # Calculate overall fairness score (0-100)
-        total_checks = 4  # Number of basic fairness checks
+        total_checks = len(_VIOLATION_CHECKS)  # Number of basic fairness checks
         violations_count = len(violations)
         overall_score = ((total_checks - violations_count) / total_checks) * 100
 
-        # Get key metric values
-        di_ratio = posttrain.get("disparate_impact", {}).get("ratio", 1.0)
-        sp_diff = posttrain.get("statistical_parity", {}).get("difference", 0.0)
-
         return {
             "overall_fairness_score": float(overall_score),
             "fairness_violations": violations,
             "n_violations": len(violations),
-            "disparate_impact_ratio": float(di_ratio),
-            "statistical_parity_diff": float(sp_diff),
+            "violation_mask": violation_mask,
+            "disparate_impact_ratio": fields.di_ratio,
+            "statistical_parity_diff": fields.sp_diff,
             "passes_basic_fairness": len(violations) == 0,
         }
 
@@ -343,24 +555,25 @@ class FairnessCalculator:
 
         recommendations = []
         posttrain = results.get("posttrain", {})
+        fields = _SummaryFields.from_posttrain(posttrain)
+        violation_mask = fields.violation_mask
 
         # Statistical parity
-        if not posttrain.get("statistical_parity", {}).get("is_fair", True):
+        if violation_mask & 1:
             recommendations.append(
                 "Statistical parity violation detected. "
                 "Consider using threshold optimization or reweighing techniques."
             )
 
         # Disparate impact
-        if not posttrain.get("disparate_impact", {}).get("passes_80_rule", True):
-            di_ratio = posttrain.get("disparate_impact", {}).get("ratio", 1.0)
+        if violation_mask & 2:
             recommendations.append(
-                f"Disparate impact ratio ({di_ratio:.2f}) fails 80% rule. "
+                f"Disparate impact ratio ({fields.di_ratio:.2f}) fails 80% rule. "
                 "Review feature selection and consider fairness-aware training."
             )
 
         # Equal opportunity
-        if not posttrain.get("equal_opportunity", {}).get("is_fair", True):
+        if violation_mask & 4:
             recommendations.append(
                 "Equal opportunity violation detected. "
                 "Different groups have unequal true positive rates. "
@@ -368,7 +581,7 @@ class FairnessCalculator:
             )
 
         # Equalized odds
-        if not posttrain.get("equalized_odds", {}).get("is_fair", True):
+        if violation_mask & 8:
             recommendations.append(
                 "Equalized odds violation detected. "
                 "Both TPR and FPR differ across groups. "
@@ -386,3 +599,4 @@ class FairnessCalculator:
     def clear_cache(self) -> None:
         """Clear cached results."""
         self.cache.clear()
+        self._results.clear()
@@ -5,15 +5,164 @@ These metrics require model predictions and evaluate fairness
 in the model's decisions across different groups.
 """
 
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import confusion_matrix
+
+from justiceai.core.metrics._groups import Factorized, factorize_groups
+from justiceai.core.metrics._kernels import _as_bits, group_confusion_counts
+
+
+@dataclass(frozen=True, slots=True)
+class GroupConfusion:
+    """
+    Per-group counts shared by the post-training metrics.
+
+    Every array is aligned with ``groups`` (order of first appearance).
+    Only labels and predictions equal to 0 or 1 enter the confusion cells.
+
+    Attributes:
+        groups: Group names (``str`` of each sensitive value)
+        tp: True positives per group
+        tn: True negatives per group
+        fp: False positives per group
+        fn: False negatives per group
+        total: Samples per group
+        correct: Samples with ``y_true == y_pred`` per group
+        pred_sum: Sum of the predictions per group
+    """
+
+    groups: list[str]
+    tp: np.ndarray
+    tn: np.ndarray
+    fp: np.ndarray
+    fn: np.ndarray
+    total: np.ndarray
+    correct: np.ndarray
+    pred_sum: np.ndarray
+
+
+def _compute_group_confusion(
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    factorized: Optional[Factorized] = None,
+) -> GroupConfusion:
+    """
+    Count everything the post-training metrics need in one pass.
+
+    ``factorized`` is an optional precomputed ``factorize_groups`` result
+    for ``sensitive_attr``.
+    """
+    if factorized is None:
+        factorized = factorize_groups(sensitive_attr)
+    codes, groups = factorized
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    n_groups = len(groups)
+
+    tn, fp, fn, tp = group_confusion_counts(y_true, y_pred, codes, n_groups).T
+
+    return GroupConfusion(
+        groups=groups,
+        tp=tp,
+        tn=tn,
+        fp=fp,
+        fn=fn,
+        total=np.bincount(codes, minlength=n_groups),
+        correct=np.bincount(codes[y_true == y_pred], minlength=n_groups),
+        pred_sum=np.bincount(codes, weights=y_pred, minlength=n_groups),
+    )
+
+
+def _compute_group_confusion_batch(
+    y_true: np.ndarray,
+    y_preds: np.ndarray,
+    sensitive_attr: pd.Series,
+    factorized: Optional[Factorized] = None,
+) -> list[GroupConfusion]:
+    """
+    ``_compute_group_confusion`` for each row of ``y_preds`` (n_models, n_samples).
+
+    Binary predictions are counted for all models with a single bincount;
+    other inputs fall back to one ``_compute_group_confusion`` per row.
+    """
+    if factorized is None:
+        factorized = factorize_groups(sensitive_attr)
+    codes, groups = factorized
+    y_true = np.asarray(y_true)
+    y_preds = np.asarray(y_preds)
+
+    true_bits = _as_bits(y_true)
+    pred_bits = _as_bits(y_preds)
+    if true_bits is None or pred_bits is None:
+        return [
+            _compute_group_confusion(y_true, y_pred, sensitive_attr, factorized)
+            for y_pred in y_preds
+        ]
+
+    # Cell of each (model, sample): model * 4G + code * 4 + (y_true << 1 | y_pred)
+    n_models, n_groups = len(y_preds), len(groups)
+    offsets = np.arange(n_models)[:, None] * (4 * n_groups) + codes * 4
+    counts = np.bincount(
+        (offsets + ((true_bits << 1) | pred_bits)).ravel(),
+        minlength=n_models * n_groups * 4,
+    ).reshape(n_models, n_groups, 4)
+    total = np.bincount(codes, minlength=n_groups)
+
+    confusions = []
+    for model_counts in counts:
+        tn, fp, fn, tp = model_counts.T
+        confusions.append(
+            GroupConfusion(
+                groups=groups,
+                tp=tp,
+                tn=tn,
+                fp=fp,
+                fn=fn,
+                total=total,
+                correct=tn + tp,
+                pred_sum=fp + tp,
+            )
+        )
+    return confusions
+
+
+def _selection_rates(
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion],
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Group names, selection rates and group sizes."""
+    if confusion is None:
+        codes, groups = factorize_groups(sensitive_attr)
+        totals = np.bincount(codes, minlength=len(groups))
+        pred_sum = np.bincount(
+            codes, weights=np.asarray(y_pred), minlength=len(groups)
+        )
+    else:
+        groups, totals, pred_sum = confusion.groups, confusion.total, confusion.pred_sum
+    return groups, _rate(pred_sum, totals), totals
+
+
+def _rate(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise ratio, 0.0 where the denominator is 0."""
+    out = np.zeros(len(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _spread(values: np.ndarray) -> float:
+    """Max - min of per-group values (0.0 without groups)."""
+    return float(np.ptp(values)) if len(values) else 0.0
 
 
 def statistical_parity(
-    y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate statistical parity (demographic parity).
@@ -25,6 +174,8 @@ def statistical_parity(
     Args:
         y_pred: Model predictions (binary: 0 or 1)
         sensitive_attr: Sensitive attribute groups
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with:
@@ -40,22 +191,18 @@ def statistical_parity(
         >>> result['by_group']['A']
         1.0
     """
-    results_by_group = {}
+    names, rates, totals = _selection_rates(y_pred, sensitive_attr, confusion)
 
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        group_preds = y_pred[mask]
-
-        selection_rate = np.mean(group_preds) if len(group_preds) > 0 else 0.0
-        results_by_group[str(group)] = {
-            "selection_rate": float(selection_rate),
-            "total_samples": int(len(group_preds)),
-        }
+    results_by_group = {
+        name: {"selection_rate": rate, "total_samples": total}
+        for name, rate, total in zip(
+            names, rates.tolist(), totals.tolist(), strict=True
+        )
+    }
 
     # Calculate overall metrics
-    selection_rates = [v["selection_rate"] for v in results_by_group.values()]
-    max_rate = max(selection_rates) if selection_rates else 0.0
-    min_rate = min(selection_rates) if selection_rates else 0.0
+    max_rate = float(rates.max()) if len(rates) else 0.0
+    min_rate = float(rates.min()) if len(rates) else 0.0
 
     difference = max_rate - min_rate
     ratio = min_rate / max_rate if max_rate > 0 else 1.0
@@ -69,7 +216,9 @@ def statistical_parity(
 
 
 def disparate_impact(
-    y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate disparate impact ratio.
@@ -82,6 +231,8 @@ def disparate_impact(
     Args:
         y_pred: Model predictions (binary)
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with:
@@ -98,11 +249,8 @@ def disparate_impact(
         0.5
     """
     # Calculate selection rates per group
-    selection_rates = {}
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        rate = np.mean(y_pred[mask]) if np.sum(mask) > 0 else 0.0
-        selection_rates[str(group)] = float(rate)
+    names, rates, _ = _selection_rates(y_pred, sensitive_attr, confusion)
+    selection_rates = dict(zip(names, rates.tolist(), strict=True))
 
     if not selection_rates:
         return {
@@ -113,25 +261,28 @@ def disparate_impact(
             "by_group": {},
         }
 
-    max_rate = max(selection_rates.values())
-    min_rate = min(selection_rates.values())
+    # First group with the highest / lowest rate
+    i_max = int(np.argmax(rates))
+    i_min = int(np.argmin(rates))
+    max_rate = float(rates[i_max])
+    min_rate = float(rates[i_min])
 
     ratio = min_rate / max_rate if max_rate > 0 else 1.0
 
-    advantaged = max(selection_rates, key=selection_rates.get)
-    disadvantaged = min(selection_rates, key=selection_rates.get)
-
     return {
         "ratio": float(ratio),
         "passes_80_rule": ratio >= 0.8,
-        "advantaged_group": advantaged,
-        "disadvantaged_group": disadvantaged,
+        "advantaged_group": names[i_max],
+        "disadvantaged_group": names[i_min],
         "by_group": selection_rates,
     }
 
 
 def equal_opportunity(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate equal opportunity (true positive rate equality).
@@ -144,6 +295,8 @@ def equal_opportunity(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with:
@@ -157,28 +310,27 @@ def equal_opportunity(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = equal_opportunity(y_true, y_pred, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        # Calculate TPR (True Positive Rate)
-        tp = np.sum((y_true_group == 1) & (y_pred_group == 1))
-        fn = np.sum((y_true_group == 1) & (y_pred_group == 0))
-
-        tpr = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-
-        results_by_group[str(group)] = {
-            "tpr": float(tpr),
-            "true_positives": int(tp),
-            "false_negatives": int(fn),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names = confusion.groups
+    tp, fn = confusion.tp, confusion.fn
+
+    # Calculate TPR (True Positive Rate)
+    tprs = _rate(tp, tp + fn)
+
+    results_by_group = {
+        name: {
+            "tpr": tpr,
+            "true_positives": tp_g,
+            "false_negatives": fn_g,
         }
+        for name, tpr, tp_g, fn_g in zip(
+            names, tprs.tolist(), tp.tolist(), fn.tolist(), strict=True
+        )
+    }
 
     # Calculate difference
-    tprs = [v["tpr"] for v in results_by_group.values()]
-    difference = max(tprs) - min(tprs) if tprs else 0.0
+    difference = _spread(tprs)
 
     return {
         "by_group": results_by_group,
@@ -188,7 +340,10 @@ def equal_opportunity(
 
 
 def equalized_odds(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate equalized odds (TPR and FPR equality).
@@ -200,6 +355,8 @@ def equalized_odds(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with:
@@ -214,38 +371,39 @@ def equalized_odds(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = equalized_odds(y_true, y_pred, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        # Calculate confusion matrix components
-        tp = np.sum((y_true_group == 1) & (y_pred_group == 1))
-        tn = np.sum((y_true_group == 0) & (y_pred_group == 0))
-        fp = np.sum((y_true_group == 0) & (y_pred_group == 1))
-        fn = np.sum((y_true_group == 1) & (y_pred_group == 0))
-
-        # Calculate TPR and FPR
-        tpr = tp / (tp + fn) if (tp + fn) > 0 else 0.0
-        fpr = fp / (fp + tn) if (fp + tn) > 0 else 0.0
-
-        results_by_group[str(group)] = {
-            "tpr": float(tpr),
-            "fpr": float(fpr),
-            "tp": int(tp),
-            "tn": int(tn),
-            "fp": int(fp),
-            "fn": int(fn),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names = confusion.groups
+    tp, tn, fp, fn = confusion.tp, confusion.tn, confusion.fp, confusion.fn
+
+    # Calculate TPR and FPR
+    tprs = _rate(tp, tp + fn)
+    fprs = _rate(fp, fp + tn)
+
+    cells = zip(
+        tprs.tolist(),
+        fprs.tolist(),
+        tp.tolist(),
+        tn.tolist(),
+        fp.tolist(),
+        fn.tolist(),
+        strict=True,
+    )
+    results_by_group = {
+        name: {
+            "tpr": tpr,
+            "fpr": fpr,
+            "tp": tp_g,
+            "tn": tn_g,
+            "fp": fp_g,
+            "fn": fn_g,
         }
+        for name, (tpr, fpr, tp_g, tn_g, fp_g, fn_g) in zip(names, cells, strict=True)
+    }
 
     # Calculate differences
-    tprs = [v["tpr"] for v in results_by_group.values()]
-    fprs = [v["fpr"] for v in results_by_group.values()]
-
-    tpr_diff = max(tprs) - min(tprs) if tprs else 0.0
-    fpr_diff = max(fprs) - min(fprs) if fprs else 0.0
+    tpr_diff = _spread(tprs)
+    fpr_diff = _spread(fprs)
 
     return {
         "by_group": results_by_group,
@@ -256,7 +414,10 @@ def equalized_odds(
 
 
 def confusion_matrix_by_group(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, dict[str, int]]:
     """
     Calculate confusion matrix stratified by sensitive attribute.
@@ -265,6 +426,8 @@ def confusion_matrix_by_group(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary mapping group -> confusion matrix components:
@@ -283,31 +446,28 @@ def confusion_matrix_by_group(
         >>> result['A']['TP']
         1
     """
-    results = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        # Calculate confusion matrix
-        tn, fp, fn, tp = confusion_matrix(
-            y_true_group, y_pred_group, labels=[0, 1]
-        ).ravel()
-
-        results[str(group)] = {
-            "TP": int(tp),
-            "TN": int(tn),
-            "FP": int(fp),
-            "FN": int(fn),
-            "total": int(len(y_true_group)),
-        }
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    cells = zip(
+        confusion.tp.tolist(),
+        confusion.tn.tolist(),
+        confusion.fp.tolist(),
+        confusion.fn.tolist(),
+        confusion.total.tolist(),
+        strict=True,
+    )
 
-    return results
+    return {
+        name: {"TP": tp, "TN": tn, "FP": fp, "FN": fn, "total": total}
+        for name, (tp, tn, fp, fn, total) in zip(confusion.groups, cells, strict=True)
+    }
 
 
 def false_negative_rate_difference(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate false negative rate (FNR) difference across groups.
@@ -319,6 +479,8 @@ def false_negative_rate_difference(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with FNR per group and difference
@@ -329,26 +491,24 @@ def false_negative_rate_difference(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = false_negative_rate_difference(y_true, y_pred, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        fn = np.sum((y_true_group == 1) & (y_pred_group == 0))
-        tp = np.sum((y_true_group == 1) & (y_pred_group == 1))
-
-        fnr = fn / (fn + tp) if (fn + tp) > 0 else 0.0
-
-        results_by_group[str(group)] = {
-            "fnr": float(fnr),
-            "false_negatives": int(fn),
-            "true_positives": int(tp),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names = confusion.groups
+    tp, fn = confusion.tp, confusion.fn
+    fnrs = _rate(fn, fn + tp)
+
+    results_by_group = {
+        name: {
+            "fnr": fnr,
+            "false_negatives": fn_g,
+            "true_positives": tp_g,
         }
+        for name, fnr, fn_g, tp_g in zip(
+            names, fnrs.tolist(), fn.tolist(), tp.tolist(), strict=True
+        )
+    }
 
-    fnrs = [v["fnr"] for v in results_by_group.values()]
-    difference = max(fnrs) - min(fnrs) if fnrs else 0.0
+    difference = _spread(fnrs)
 
     return {
         "by_group": results_by_group,
@@ -358,7 +518,10 @@ def false_negative_rate_difference(
 
 
 def predictive_parity(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate predictive parity (PPV/Precision equality).
@@ -370,6 +533,8 @@ def predictive_parity(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with PPV (precision) per group and difference
@@ -380,27 +545,25 @@ def predictive_parity(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = predictive_parity(y_true, y_pred, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        tp = np.sum((y_true_group == 1) & (y_pred_group == 1))
-        fp = np.sum((y_true_group == 0) & (y_pred_group == 1))
-
-        ppv = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-
-        results_by_group[str(group)] = {
-            "ppv": float(ppv),
-            "precision": float(ppv),
-            "true_positives": int(tp),
-            "false_positives": int(fp),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names = confusion.groups
+    tp, fp = confusion.tp, confusion.fp
+    ppvs = _rate(tp, tp + fp)
+
+    results_by_group = {
+        name: {
+            "ppv": ppv,
+            "precision": ppv,
+            "true_positives": tp_g,
+            "false_positives": fp_g,
         }
+        for name, ppv, tp_g, fp_g in zip(
+            names, ppvs.tolist(), tp.tolist(), fp.tolist(), strict=True
+        )
+    }
 
-    ppvs = [v["ppv"] for v in results_by_group.values()]
-    difference = max(ppvs) - min(ppvs) if ppvs else 0.0
+    difference = _spread(ppvs)
 
     return {
         "by_group": results_by_group,
@@ -410,7 +573,10 @@ def predictive_parity(
 
 
 def negative_predictive_parity(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate negative predictive parity (NPV equality).
@@ -421,6 +587,8 @@ def negative_predictive_parity(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with NPV per group and difference
@@ -431,26 +599,24 @@ def negative_predictive_parity(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = negative_predictive_parity(y_true, y_pred, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        tn = np.sum((y_true_group == 0) & (y_pred_group == 0))
-        fn = np.sum((y_true_group == 1) & (y_pred_group == 0))
-
-        npv = tn / (tn + fn) if (tn + fn) > 0 else 0.0
-
-        results_by_group[str(group)] = {
-            "npv": float(npv),
-            "true_negatives": int(tn),
-            "false_negatives": int(fn),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names = confusion.groups
+    tn, fn = confusion.tn, confusion.fn
+    npvs = _rate(tn, tn + fn)
+
+    results_by_group = {
+        name: {
+            "npv": npv,
+            "true_negatives": tn_g,
+            "false_negatives": fn_g,
         }
+        for name, npv, tn_g, fn_g in zip(
+            names, npvs.tolist(), tn.tolist(), fn.tolist(), strict=True
+        )
+    }
 
-    npvs = [v["npv"] for v in results_by_group.values()]
-    difference = max(npvs) - min(npvs) if npvs else 0.0
+    difference = _spread(npvs)
 
     return {
         "by_group": results_by_group,
@@ -460,7 +626,10 @@ def negative_predictive_parity(
 
 
 def accuracy_difference(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate accuracy difference across groups.
@@ -471,6 +640,8 @@ def accuracy_difference(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with accuracy per group and difference
@@ -483,26 +654,23 @@ def accuracy_difference(
         >>> result['by_group']['A']['accuracy']
         1.0
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        correct = np.sum(y_true_group == y_pred_group)
-        total = len(y_true_group)
-
-        accuracy = correct / total if total > 0 else 0.0
-
-        results_by_group[str(group)] = {
-            "accuracy": float(accuracy),
-            "correct": int(correct),
-            "total": int(total),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names, correct, totals = confusion.groups, confusion.correct, confusion.total
+    accuracies = _rate(correct, totals)
+
+    results_by_group = {
+        name: {
+            "accuracy": accuracy,
+            "correct": correct_g,
+            "total": total,
         }
+        for name, accuracy, correct_g, total in zip(
+            names, accuracies.tolist(), correct.tolist(), totals.tolist(), strict=True
+        )
+    }
 
-    accuracies = [v["accuracy"] for v in results_by_group.values()]
-    difference = max(accuracies) - min(accuracies) if accuracies else 0.0
+    difference = _spread(accuracies)
 
     return {
         "by_group": results_by_group,
@@ -512,7 +680,10 @@ def accuracy_difference(
 
 
 def treatment_equality(
-    y_true: np.ndarray, y_pred: np.ndarray, sensitive_attr: pd.Series
+    y_true: np.ndarray,
+    y_pred: np.ndarray,
+    sensitive_attr: pd.Series,
+    confusion: Optional[GroupConfusion] = None,
 ) -> dict[str, Any]:
     """
     Calculate treatment equality (FN/FP ratio equality).
@@ -524,6 +695,8 @@ def treatment_equality(
         y_true: True labels
         y_pred: Model predictions
         sensitive_attr: Sensitive attribute
+        confusion: Precomputed counts from ``_compute_group_confusion``;
+            when given, the arrays above are not scanned again
 
     Returns:
         Dictionary with FN/FP ratio per group and difference
@@ -534,31 +707,27 @@ def treatment_equality(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = treatment_equality(y_true, y_pred, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_pred_group = y_pred[mask]
-
-        fn = np.sum((y_true_group == 1) & (y_pred_group == 0))
-        fp = np.sum((y_true_group == 0) & (y_pred_group == 1))
-
-        ratio = fn / fp if fp > 0 else (float("inf") if fn > 0 else 1.0)
-
-        results_by_group[str(group)] = {
-            "fn_fp_ratio": float(ratio) if ratio != float("inf") else None,
-            "false_negatives": int(fn),
-            "false_positives": int(fp),
+    if confusion is None:
+        confusion = _compute_group_confusion(y_true, y_pred, sensitive_attr)
+    names = confusion.groups
+    fp, fn = confusion.fp, confusion.fn
+    # FN/FP per group: None (infinite) when FP == 0 < FN, 1.0 when both 0
+    ratios = np.ones(len(names))
+    np.divide(fn, fp, out=ratios, where=fp > 0)
+
+    results_by_group = {
+        name: {
+            "fn_fp_ratio": None if fp_g == 0 and fn_g > 0 else ratio,
+            "false_negatives": fn_g,
+            "false_positives": fp_g,
         }
+        for name, ratio, fn_g, fp_g in zip(
+            names, ratios.tolist(), fn.tolist(), fp.tolist(), strict=True
+        )
+    }
 
     # Calculate difference (excluding infinite values)
-    ratios = [
-        v["fn_fp_ratio"]
-        for v in results_by_group.values()
-        if v["fn_fp_ratio"] is not None
-    ]
-    difference = max(ratios) - min(ratios) if len(ratios) > 1 else 0.0
+    difference = _spread(ratios[(fp > 0) | (fn == 0)])
 
     return {
         "by_group": results_by_group,
@@ -567,11 +736,159 @@ def treatment_equality(
     }
 
 
+def _spread_result(
+    by_group: dict[str, Any], values: np.ndarray, limit: float
+) -> dict[str, Any]:
+    """Result dict for metrics judged by the max - min spread of a rate."""
+    difference = _spread(values)
+    return {
+        "by_group": by_group,
+        "difference": difference,
+        "is_fair": difference < limit,
+    }
+
+
+def _assemble_posttrain(confusion: GroupConfusion) -> dict[str, Any]:
+    """
+    All confusion-based post-training metrics from one set of counts.
+
+    Gives the same results as calling each metric function above with
+    ``confusion=``, but computes every rate vector once and fills all the
+    per-group dicts in a single loop over the groups. Keys match
+    ``FairnessCalculator.calculate_posttrain_metrics``.
+
+    Args:
+        confusion: Counts from ``_compute_group_confusion``
+
+    Returns:
+        Dictionary of metric name to that metric's result
+    """
+    c = confusion
+    selection = _rate(c.pred_sum, c.total)
+    tprs = _rate(c.tp, c.tp + c.fn)
+    fprs = _rate(c.fp, c.fp + c.tn)
+    fnrs = _rate(c.fn, c.fn + c.tp)
+    ppvs = _rate(c.tp, c.tp + c.fp)
+    npvs = _rate(c.tn, c.tn + c.fn)
+    accuracies = _rate(c.correct, c.total)
+    fn_fp = np.ones(len(c.groups))
+    np.divide(c.fn, c.fp, out=fn_fp, where=c.fp > 0)
+
+    # Python scalars for the dicts, converted once per vector
+    sel, tpr, fpr, fnr, ppv, npv, acc, ratio = (
+        v.tolist()
+        for v in (selection, tprs, fprs, fnrs, ppvs, npvs, accuracies, fn_fp)
+    )
+    tp, tn, fp, fn, total, correct = (
+        v.tolist() for v in (c.tp, c.tn, c.fp, c.fn, c.total, c.correct)
+    )
+
+    sp_by, di_by, eo_by, eod_by, cm_by = {}, {}, {}, {}, {}
+    fnr_by, ppv_by, npv_by, acc_by, te_by = {}, {}, {}, {}, {}
+    for i, name in enumerate(c.groups):
+        sp_by[name] = {"selection_rate": sel[i], "total_samples": total[i]}
+        di_by[name] = sel[i]
+        eo_by[name] = {
+            "tpr": tpr[i],
+            "true_positives": tp[i],
+            "false_negatives": fn[i],
+        }
+        eod_by[name] = {
+            "tpr": tpr[i],
+            "fpr": fpr[i],
+            "tp": tp[i],
+            "tn": tn[i],
+            "fp": fp[i],
+            "fn": fn[i],
+        }
+        cm_by[name] = {
+            "TP": tp[i],
+            "TN": tn[i],
+            "FP": fp[i],
+            "FN": fn[i],
+            "total": total[i],
+        }
+        fnr_by[name] = {
+            "fnr": fnr[i],
+            "false_negatives": fn[i],
+            "true_positives": tp[i],
+        }
+        ppv_by[name] = {
+            "ppv": ppv[i],
+            "precision": ppv[i],
+            "true_positives": tp[i],
+            "false_positives": fp[i],
+        }
+        npv_by[name] = {
+            "npv": npv[i],
+            "true_negatives": tn[i],
+            "false_negatives": fn[i],
+        }
+        acc_by[name] = {"accuracy": acc[i], "correct": correct[i], "total": total[i]}
+        te_by[name] = {
+            "fn_fp_ratio": None if fp[i] == 0 and fn[i] > 0 else ratio[i],
+            "false_negatives": fn[i],
+            "false_positives": fp[i],
+        }
+
+    max_rate = float(selection.max()) if len(selection) else 0.0
+    min_rate = float(selection.min()) if len(selection) else 0.0
+    sp_diff = max_rate - min_rate
+    sp_ratio = min_rate / max_rate if max_rate > 0 else 1.0
+    if di_by:
+        disparate = {
+            "ratio": sp_ratio,
+            "passes_80_rule": sp_ratio >= 0.8,
+            "advantaged_group": c.groups[int(np.argmax(selection))],
+            "disadvantaged_group": c.groups[int(np.argmin(selection))],
+            "by_group": di_by,
+        }
+    else:
+        disparate = {
+            "ratio": 1.0,
+            "passes_80_rule": True,
+            "advantaged_group": None,
+            "disadvantaged_group": None,
+            "by_group": {},
+        }
+
+    tpr_diff, fpr_diff = _spread(tprs), _spread(fprs)
+    te_diff = _spread(fn_fp[(c.fp > 0) | (c.fn == 0)])
+
+    return {
+        "statistical_parity": {
+            "by_group": sp_by,
+            "difference": sp_diff,
+            "ratio": sp_ratio,
+            "is_fair": sp_diff < 0.1,
+        },
+        "disparate_impact": disparate,
+        "equal_opportunity": _spread_result(eo_by, tprs, 0.1),
+        "equalized_odds": {
+            "by_group": eod_by,
+            "tpr_difference": tpr_diff,
+            "fpr_difference": fpr_diff,
+            "is_fair": (tpr_diff < 0.1) and (fpr_diff < 0.1),
+        },
+        "confusion_matrix": cm_by,
+        "false_negative_rate_diff": _spread_result(fnr_by, fnrs, 0.1),
+        "predictive_parity": _spread_result(ppv_by, ppvs, 0.1),
+        "negative_predictive_parity": _spread_result(npv_by, npvs, 0.1),
+        "accuracy_difference": _spread_result(acc_by, accuracies, 0.05),
+        "treatment_equality": {
+            "by_group": te_by,
+            "difference": float(te_diff),
+            "is_fair": te_diff < 0.2,
+        },
+    }
+
+
 def calibration_by_group(
     y_true: np.ndarray,
     y_pred_proba: np.ndarray,
     sensitive_attr: pd.Series,
     n_bins: int = 10,
+    factorized: Optional[Factorized] = None,
 ) -> dict[str, Any]:
     """
     Calculate calibration (reliability) by group.
@@ -584,6 +901,7 @@ def calibration_by_group(
         y_pred_proba: Predicted probabilities (not binary predictions)
         sensitive_attr: Sensitive attribute
         n_bins: Number of bins for calibration curve
+        factorized: Precomputed ``factorize_groups(sensitive_attr)`` result
 
     Returns:
         Dictionary with calibration metrics per group
@@ -594,37 +912,37 @@ def calibration_by_group(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B'])
         >>> result = calibration_by_group(y_true, y_proba, sensitive)
     """
-    results_by_group = {}
-
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_true_group = y_true[mask]
-        y_proba_group = y_pred_proba[mask]
-
-        # Create bins
-        bin_edges = np.linspace(0, 1, n_bins + 1)
-        bin_indices = np.digitize(y_proba_group, bin_edges) - 1
-        bin_indices = np.clip(bin_indices, 0, n_bins - 1)
-
-        # Calculate calibration per bin
-        calibration_errors = []
-        for i in range(n_bins):
-            mask_bin = bin_indices == i
-            if np.sum(mask_bin) > 0:
-                predicted_prob = np.mean(y_proba_group[mask_bin])
-                actual_rate = np.mean(y_true_group[mask_bin])
-                calibration_errors.append(abs(actual_rate - predicted_prob))
-
-        # Expected Calibration Error (ECE)
-        ece = np.mean(calibration_errors) if calibration_errors else 0.0
-
-        results_by_group[str(group)] = {
-            "expected_calibration_error": float(ece),
-            "n_bins": n_bins,
-        }
+    if factorized is None:
+        factorized = factorize_groups(sensitive_attr)
+    codes, names = factorized
+    y_pred_proba = np.asarray(y_pred_proba)
+
+    # Bin every sample once, then aggregate per (group, bin) cell
+    bin_edges = np.linspace(0, 1, n_bins + 1)
+    bin_indices = np.clip(np.digitize(y_pred_proba, bin_edges) - 1, 0, n_bins - 1)
+    cells = codes * n_bins + bin_indices
+    size = len(names) * n_bins
+    counts = np.bincount(cells, minlength=size).reshape(-1, n_bins)
+    proba_sums = np.bincount(cells, weights=y_pred_proba, minlength=size)
+    true_sums = np.bincount(cells, weights=np.asarray(y_true), minlength=size)
+
+    # Calibration error per non-empty bin; ECE is their mean per group
+    filled = counts > 0
+    errors = np.zeros(counts.shape)
+    np.divide(
+        np.abs(true_sums - proba_sums).reshape(-1, n_bins),
+        counts,
+        out=errors,
+        where=filled,
+    )
+    eces = _rate(errors.sum(axis=1), filled.sum(axis=1))
+
+    results_by_group = {
+        name: {"expected_calibration_error": ece, "n_bins": n_bins}
+        for name, ece in zip(names, eces.tolist(), strict=True)
+    }
 
-    eces = [v["expected_calibration_error"] for v in results_by_group.values()]
-    difference = max(eces) - min(eces) if eces else 0.0
+    difference = _spread(eces)
 
     return {
         "by_group": results_by_group,
@@ -5,15 +5,31 @@ These metrics can be calculated on the dataset before training any model,
 helping identify potential biases in the data distribution.
 """
 
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 from scipy.stats import entropy
 
+from justiceai.core.metrics._groups import Factorized, factorize_groups
+
+
+def _split_by_group(
+    y: pd.Series, sensitive_attr: pd.Series, factorized: Optional[Factorized]
+) -> tuple[list[str], list[pd.Series]]:
+    """Group names and the rows of ``y`` in each group (row order kept)."""
+    if factorized is None:
+        factorized = factorize_groups(sensitive_attr)
+    codes, names = factorized
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(names)))[:-1]
+    return names, [y.iloc[rows] for rows in np.split(order, bounds)]
+
 
 def class_balance(
-    y: pd.Series, sensitive_attr: pd.Series
+    y: pd.Series,
+    sensitive_attr: pd.Series,
+    factorized: Optional[Factorized] = None,
 ) -> dict[str, dict[str, Any]]:
     """
     Calculate class balance across sensitive attribute groups.
@@ -25,6 +41,7 @@ def class_balance(
     Args:
         y: Target variable (labels)
         sensitive_attr: Sensitive attribute (e.g., gender, race)
+        factorized: Precomputed ``factorize_groups(sensitive_attr)`` result
 
     Returns:
         Dictionary with balance metrics per group:
@@ -43,12 +60,10 @@ def class_balance(
         >>> result['A']['balance_score']
         1.0  # Perfectly balanced for group A
     """
+    names, y_groups = _split_by_group(y, sensitive_attr, factorized)
     results = {}
 
-    for group in sensitive_attr.unique():
-        mask = sensitive_attr == group
-        y_group = y[mask]
-
+    for name, y_group in zip(names, y_groups, strict=True):
         # Count classes
         class_counts = y_group.value_counts().to_dict()
         total = len(y_group)
@@ -65,7 +80,7 @@ def class_balance(
             proportions = np.array(list(class_counts.values())) / total
             balance_score = entropy(proportions) / np.log(n_classes)
 
-        results[str(group)] = {
+        results[name] = {
             "class_distribution": class_counts,
             "majority_class_ratio": float(majority_ratio),
             "balance_score": float(balance_score),
@@ -209,7 +224,9 @@ def js_divergence(dist1: np.ndarray, dist2: np.ndarray) -> float:
 
 
 def group_distribution_difference(
-    y: pd.Series, sensitive_attr: pd.Series
+    y: pd.Series,
+    sensitive_attr: pd.Series,
+    factorized: Optional[Factorized] = None,
 ) -> dict[str, Any]:
     """
     Calculate distribution differences across sensitive attribute groups.
@@ -220,6 +237,7 @@ def group_distribution_difference(
     Args:
         y: Target variable
         sensitive_attr: Sensitive attribute
+        factorized: Precomputed ``factorize_groups(sensitive_attr)`` result
 
     Returns:
         Dictionary with pairwise divergence metrics between groups
@@ -229,22 +247,20 @@ def group_distribution_difference(
         >>> sensitive = pd.Series(['A', 'A', 'B', 'B', 'C', 'C'])
         >>> result = group_distribution_difference(y, sensitive)
     """
-    groups = sensitive_attr.unique()
+    groups, y_groups = _split_by_group(y, sensitive_attr, factorized)
     results = {}
 
     # Calculate distribution for each group
-    group_distributions = {}
-    for group in groups:
-        mask = sensitive_attr == group
-        y_group = y[mask]
-        dist = y_group.value_counts(normalize=True).sort_index()
-        group_distributions[str(group)] = dist
+    group_distributions = {
+        group: y_group.value_counts(normalize=True).sort_index()
+        for group, y_group in zip(groups, y_groups, strict=True)
+    }
 
     # Calculate pairwise divergences
     for i, group1 in enumerate(groups):
         for group2 in groups[i + 1 :]:
-            dist1 = group_distributions[str(group1)]
-            dist2 = group_distributions[str(group2)]
+            dist1 = group_distributions[group1]
+            dist2 = group_distributions[group2]
 
             # Align distributions (ensure same classes)
             all_classes = sorted(set(dist1.index) | set(dist2.index))
@@ -1,5 +1,7 @@
 """Tests for BACEN compliance module."""
 
+from dataclasses import asdict
+
 import pytest
 from sklearn.datasets import make_classification
 from sklearn.ensemble import RandomForestClassifier
@@ -154,3 +156,89 @@ class TestBACENComplianceReporter:
         assert "recomendacoes" in compliance_data
         assert isinstance(compliance_data["recomendacoes"], list)
         assert len(compliance_data["recomendacoes"]) > 0
+
+    @pytest.fixture
+    def biased_report(self):
+        """Create a fairness report with a clear selection-rate disparity."""
+        import pandas as pd
+
+        X, y = make_classification(n_samples=200, n_features=5, random_state=42)
+        y[:80] = 1  # Group 0 gets far more positive outcomes
+
+        model = RandomForestClassifier(n_estimators=10, random_state=42)
+        model.fit(X, y)
+
+        gender = pd.Series([0] * 100 + [1] * 100)
+        return audit(model, X, y, sensitive_attrs=gender)
+
+    def test_identify_disparities(self, biased_report):
+        """Test disparities are identified per group and cached."""
+        reporter = BACENComplianceReporter(biased_report)
+
+        disparities = reporter._disparities
+
+        assert len(disparities) > 0
+        for disp in disparities:
+            assert disp.valor < disp.threshold == 0.8
+            assert disp.severidade in ["Alta", "Média"]
+        assert reporter._disparities is disparities
+
+        compliance_data = reporter.generate_report()
+        risk = compliance_data["risco_modelo"]
+        assert risk["total_disparidades"] == len(disparities)
+        assert (
+            compliance_data["fairness_assessment"]["disparidades_identificadas"]
+            == [asdict(disp) for disp in disparities]
+        )
+
+    def test_save_html_with_disparities(self, biased_report, tmp_path):
+        """Test saving HTML when disparities are present."""
+        reporter = BACENComplianceReporter(biased_report)
+
+        output_file = tmp_path / "bacen_report.html"
+        reporter.save_html(str(output_file))
+
+        content = output_file.read_text()
+        assert "Disparidades Identificadas" in content
+        assert "Statistical Parity" in content
+
+    def test_escape_tree(self):
+        """Test that nested report values are HTML-escaped once."""
+        from justiceai.compliance.bacen import _escape_tree
+
+        escaped = _escape_tree({"a": ["<b>", 1], "b": {"c": "x & y"}, "d": 0.5})
+        assert escaped == {"a": ["&lt;b&gt;", 1], "b": {"c": "x &amp; y"}, "d": 0.5}
+
+    def test_save_html_renders_base_report_once(self, fairness_report, tmp_path):
+        """Test that repeated saves reuse the rendered fairness report."""
+        reporter = BACENComplianceReporter(fairness_report)
+
+        reporter.save_html(str(tmp_path / "first.html"))
+        base_html = reporter._base_html
+        reporter.save_html(str(tmp_path / "second.html"))
+
+        assert reporter._base_html is base_html
+        content = (tmp_path / "second.html").read_text()
+        assert content.index("Relatório de Conformidade BACEN") < content.rindex(
+            "</body>"
+        )
+
+    def test_disparities_skip_missing_rates(self):
+        """Test that groups without a rate are not compared."""
+        from types import SimpleNamespace
+
+        metrics = {
+            "posttrain": {
+                "statistical_parity": {
+                    "by_group": {
+                        "a": {"selection_rate": 0.5},
+                        "b": {"selection_rate": 0.2},
+                        "c": {},
+                    }
+                }
+            }
+        }
+        reporter = BACENComplianceReporter(SimpleNamespace(metrics=metrics))
+
+        assert reporter._analyzed_groups == ["a", "b", "c"]
+        assert [d.grupo for d in reporter._disparities] == ["b"]
@@ -0,0 +1,23 @@
+"""Tests for the shared compliance disparity scan."""
+
+import numpy as np
+
+from justiceai.compliance._disparities import scan_disparities
+
+
+class TestScanDisparities:
+    """Tests for scan_disparities."""
+
+    def test_flags_groups_below_best_group(self):
+        """Test ratios, severities and order of the flagged groups."""
+        rates = np.array([[0.5, 0.9], [0.35, np.nan], [0.25, 0.6]])
+
+        disparities = scan_disparities(["a", "b", "c"], ["SP", "EO"], rates)
+
+        assert [(d.metrica, d.grupo, d.severidade) for d in disparities] == [
+            ("SP", "b", "Média"),
+            ("SP", "c", "Alta"),
+            ("EO", "c", "Média"),
+        ]
+        assert disparities[0].valor == 0.7
+        assert disparities[0].desvio == 0.8 - 0.7
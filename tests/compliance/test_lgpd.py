@@ -100,3 +100,111 @@ class TestLGPDComplianceReporter:
         assert isinstance(recommendations, list)
         # Should have recommendations about mitigation
         assert any("ATENÇÃO" in rec or "problema" in rec for rec in recommendations)
+
+    @pytest.fixture
+    def biased_report(self):
+        """Create a fairness report with a clear selection-rate disparity."""
+        import pandas as pd
+
+        X, y = make_classification(n_samples=200, n_features=5, random_state=42)
+        y[:80] = 1  # Group 0 gets far more positive outcomes
+
+        model = RandomForestClassifier(n_estimators=10, random_state=42)
+        model.fit(X, y)
+
+        gender = pd.Series([0] * 100 + [1] * 100)
+        return audit(model, X, y, sensitive_attrs=gender)
+
+    def test_disparities(self, biased_report):
+        """Test statistical parity disparities are identified per group."""
+        reporter = LGPDComplianceReporter(biased_report)
+
+        compliance_data = reporter.generate_report()
+        assessment = compliance_data["avaliacao_fairness"]
+
+        disparities = assessment["disparidades_identificadas"]
+        assert len(disparities) > 0
+        for disp in disparities:
+            assert disp["metrica"] == "Statistical Parity"
+            assert disp["valor"] < disp["threshold"] == 0.8
+            assert disp["severidade"] in ["Alta", "Média"]
+        assert assessment["grupos_comparados"] == ("0", "1")
+        assert compliance_data["metricas_bias"]["total_disparidades"] == len(
+            disparities
+        )
+        assert (
+            f"ATENÇÃO: {len(disparities)} problema(s)"
+            in compliance_data["recomendacoes"][3]
+        )
+
+    def test_save_html_with_disparities(self, biased_report, tmp_path):
+        """Test saving HTML when disparities are present."""
+        reporter = LGPDComplianceReporter(biased_report)
+
+        output_file = tmp_path / "lgpd_report.html"
+        reporter.save_html(str(output_file))
+
+        content = output_file.read_text()
+        assert "Disparidades Identificadas" in content
+        assert "Statistical Parity" in content
+
+    def test_save_html_renders_base_report_once(self, fairness_report, tmp_path):
+        """Test that repeated saves reuse the rendered fairness report."""
+        reporter = LGPDComplianceReporter(fairness_report)
+
+        reporter.save_html(str(tmp_path / "first.html"))
+        base_html = reporter._base_html
+        reporter.save_html(str(tmp_path / "second.html"))
+
+        assert reporter._base_html is base_html
+        content = (tmp_path / "second.html").read_text()
+        assert content.index("Relatório de Conformidade LGPD") < content.rindex(
+            "</body>"
+        )
+
+    def test_save_html_overwrites_atomically(self, fairness_report, tmp_path):
+        """Test saving over an existing file leaves no temporary file behind."""
+        reporter = LGPDComplianceReporter(fairness_report)
+
+        output_file = tmp_path / "lgpd_report.html"
+        output_file.write_text("old")
+        reporter.save_html(str(output_file))
+
+        assert "LGPD" in output_file.read_text(encoding="utf-8")
+        assert list(tmp_path.iterdir()) == [output_file]
+
+    def test_save_html_failure_removes_temporary_file(
+        self, fairness_report, tmp_path, monkeypatch
+    ):
+        """Test a failed save keeps the old file and removes the temporary one."""
+        import os
+
+        reporter = LGPDComplianceReporter(fairness_report)
+        output_file = tmp_path / "lgpd_report.html"
+        output_file.write_text("old")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            reporter.save_html(str(output_file))
+
+        assert output_file.read_text() == "old"
+        assert list(tmp_path.iterdir()) == [output_file]
+
+    def test_scan_metrics_returns_disparity_records(self, biased_report):
+        """Test disparities are slotted records exported as dicts."""
+        from dataclasses import asdict
+
+        from justiceai.compliance.lgpd import Disparity
+
+        reporter = LGPDComplianceReporter(biased_report)
+        _, disparities = reporter._scan_metrics()
+
+        assert all(isinstance(disp, Disparity) for disp in disparities)
+        assert not hasattr(disparities[0], "__dict__")
+        assessment = reporter.to_dict()["avaliacao_fairness"]
+        assert assessment["disparidades_identificadas"] == [
+            asdict(disp) for disp in disparities
+        ]
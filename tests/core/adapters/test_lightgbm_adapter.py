@@ -115,6 +115,72 @@ class TestLightGBMAdapter:
 
         np.testing.assert_array_almost_equal(adapter_proba, original_proba)
 
+    def test_batched_predictions_match(self, trained_model, sample_data: tuple):
+        """Test that predicting in batches matches a single model call."""
+        import pandas as pd
+
+        from justiceai.core.adapters.lightgbm_adapter import LightGBMAdapter
+
+        X, y = sample_data
+        booster = lgb.train(
+            {"objective": "binary", "verbose": -1}, lgb.Dataset(X, y), 10
+        )
+        adapter = LightGBMAdapter(booster, batch_size=7, num_threads=1)
+
+        np.testing.assert_array_almost_equal(
+            adapter.predict_proba(X), booster.predict(X)
+        )
+        predictions = adapter.predict(X)
+        assert predictions.dtype == np.int64
+        np.testing.assert_array_equal(
+            predictions, (booster.predict(X) > 0.5).astype(int)
+        )
+
+        X_df = pd.DataFrame(X)
+        adapter = LightGBMAdapter(trained_model, batch_size=7)
+        np.testing.assert_array_equal(
+            adapter.predict(X_df), trained_model.predict(X_df)
+        )
+        np.testing.assert_array_almost_equal(
+            adapter.predict_proba(X_df), trained_model.predict_proba(X_df)[:, 1]
+        )
+
+    def test_prepare_X_layout(self, trained_model, sample_data: tuple):
+        """Test that only non-contiguous inputs are copied."""
+        from justiceai.core.adapters.lightgbm_adapter import LightGBMAdapter
+
+        X, _ = sample_data
+        adapter = LightGBMAdapter(trained_model)
+
+        X_fortran = np.asfortranarray(X)
+        assert adapter._prepare_X(X_fortran) is X_fortran
+        X_view = X[::2]
+        assert adapter._prepare_X(X_view).flags.c_contiguous
+        np.testing.assert_array_equal(
+            adapter.predict(X_view), trained_model.predict(X_view)
+        )
+
+    def test_booster_predict_then_proba_runs_once(self, sample_data: tuple):
+        """Test Booster labels and probabilities for one X share an inference."""
+        from justiceai.core.adapters.lightgbm_adapter import LightGBMAdapter
+
+        X, y = sample_data
+        booster = lgb.train(
+            {"objective": "binary", "verbose": -1}, lgb.Dataset(X, y), 10
+        )
+        adapter = LightGBMAdapter(booster)
+        calls = []
+        predict = adapter._predict_booster
+        adapter._predict_booster = lambda X: calls.append(1) or predict(X)
+
+        adapter.predict(X)
+        proba = adapter.predict_proba(X)
+        assert len(calls) == 1
+
+        proba[proba < 0.1] = 0
+        adapter.predict_proba(X)
+        assert len(calls) == 2
+
     def test_invalid_model(self):
         """Test that invalid model raises error."""
         from justiceai.core.adapters.lightgbm_adapter import LightGBMAdapter
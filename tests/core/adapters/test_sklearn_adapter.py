@@ -91,6 +91,27 @@ class TestSklearnAdapter:
                 assert probabilities is not None
                 assert len(probabilities) == len(X)
 
+    def test_predict_proba_multiclass(self) -> None:
+        """Test that multiclass models return the full probability matrix."""
+        X, y = make_classification(
+            n_samples=90, n_features=5, n_informative=3, n_classes=3, random_state=0
+        )
+        model = LogisticRegression(max_iter=200).fit(X, y)
+        adapter = SklearnAdapter(model)
+
+        np.testing.assert_array_equal(adapter.predict_proba(X), model.predict_proba(X))
+
+    def test_predict_proba_refit_to_multiclass(self, sample_data: tuple) -> None:
+        """Test that a binary model refit on three classes returns all columns."""
+        X, y = sample_data
+        model = LogisticRegression(max_iter=200).fit(X, y)
+        adapter = SklearnAdapter(model)
+        assert adapter.predict_proba(X).ndim == 1
+
+        model.fit(X, np.arange(len(X)) % 3)
+
+        np.testing.assert_array_equal(adapter.predict_proba(X), model.predict_proba(X))
+
     def test_invalid_model(self) -> None:
         """Test that invalid model raises error."""
 
@@ -109,6 +130,18 @@ class TestSklearnAdapter:
         assert isinstance(adapter, SklearnAdapter)
         assert adapter.model is trained_model
 
+    def test_create_adapter_memoizes_dispatch(
+        self, trained_model: RandomForestClassifier
+    ) -> None:
+        """Test that adapter dispatch is resolved once per model type."""
+        from justiceai.core.adapters import model_factory
+
+        model_factory._ADAPTER_CACHE.pop(RandomForestClassifier, None)
+        create_adapter(trained_model)
+
+        assert model_factory._ADAPTER_CACHE[RandomForestClassifier] is SklearnAdapter
+        assert isinstance(create_adapter(trained_model), SklearnAdapter)
+
     def test_predictions_match_original(
         self, trained_model: RandomForestClassifier, sample_data: tuple
     ) -> None:
@@ -133,6 +166,33 @@ class TestSklearnAdapter:
 
         np.testing.assert_array_almost_equal(adapter_proba, original_proba)
 
+    def test_predict_proba_sees_refit(self, sample_data: tuple) -> None:
+        """Test that refitting the wrapped model changes the probabilities."""
+        X, y = sample_data
+        model = LogisticRegression().fit(X, y)
+        adapter = SklearnAdapter(model)
+        adapter.predict_proba(X)
+
+        model.fit(X, 1 - y)
+
+        np.testing.assert_array_equal(
+            adapter.predict_proba(X), model.predict_proba(X)[:, 1]
+        )
+
+    def test_predict_proba_is_writable(
+        self, trained_model: RandomForestClassifier, sample_data: tuple
+    ) -> None:
+        """Test that callers can modify the returned probabilities."""
+        X, _ = sample_data
+        adapter = SklearnAdapter(trained_model)
+
+        proba = adapter.predict_proba(X)
+        proba[proba < 0.1] = 0
+
+        np.testing.assert_array_equal(
+            adapter.predict_proba(X), trained_model.predict_proba(X)[:, 1]
+        )
+
     def test_model_with_predict_method(self, sample_data: tuple) -> None:
         """Test adapter fallback for any model with predict method."""
         X, y = sample_data
@@ -115,6 +115,44 @@ class TestXGBoostAdapter:
 
         np.testing.assert_array_almost_equal(adapter_proba, original_proba)
 
+    def test_booster_matches_dmatrix(self, sample_data: tuple):
+        """Test Booster predictions on non-contiguous float64 input."""
+        from justiceai.core.adapters.xgboost_adapter import XGBoostAdapter
+
+        X, y = sample_data
+        booster = xgb.train(
+            {"objective": "binary:logistic"}, xgb.DMatrix(X, label=y), 10
+        )
+        X_view = np.asfortranarray(X)[:, :]
+        adapter = XGBoostAdapter(booster)
+
+        expected = booster.predict(xgb.DMatrix(X))
+        np.testing.assert_array_almost_equal(adapter.predict_proba(X_view), expected)
+        predictions = adapter.predict(X_view)
+        assert predictions.dtype == np.int64
+        np.testing.assert_array_equal(predictions, (expected > 0.5).astype(int))
+
+    def test_booster_predict_then_proba_runs_once(self, sample_data: tuple):
+        """Test Booster labels and probabilities for one X share an inference."""
+        from justiceai.core.adapters.xgboost_adapter import XGBoostAdapter
+
+        X, y = sample_data
+        booster = xgb.train(
+            {"objective": "binary:logistic"}, xgb.DMatrix(X, label=y), 10
+        )
+        adapter = XGBoostAdapter(booster)
+        calls = []
+        predict = adapter._booster_predict
+        adapter._booster_predict = lambda X: calls.append(1) or predict(X)
+
+        adapter.predict(X)
+        proba = adapter.predict_proba(X)
+        assert len(calls) == 1
+
+        proba[proba < 0.1] = 0
+        adapter.predict_proba(X)
+        assert len(calls) == 2
+
     def test_invalid_model(self):
         """Test that invalid model raises error."""
         from justiceai.core.adapters.xgboost_adapter import XGBoostAdapter
@@ -0,0 +1,24 @@
+"""Tests for threshold analysis numeric kernels."""
+
+import numpy as np
+
+from justiceai.core.evaluators._kernels import group_confusion_counts
+
+
+class TestGroupConfusionCounts:
+    """Tests for the per-group confusion count kernel."""
+
+    def test_counts_at_cut_points(self):
+        """Test TP/FP counts among the first cut samples of each group."""
+        y_sorted = np.array([True, False, True, True, False])
+        codes_sorted = np.array([0, 1, 1, 0, 0])
+        cut = np.array([5, 0, 2])
+
+        tp, fp, positives, negatives = group_confusion_counts(
+            y_sorted, codes_sorted, cut, 2
+        )
+
+        assert tp.tolist() == [[2, 1], [0, 0], [1, 0]]
+        assert fp.tolist() == [[1, 1], [0, 0], [0, 1]]
+        assert positives.tolist() == [2, 1]
+        assert negatives.tolist() == [1, 1]
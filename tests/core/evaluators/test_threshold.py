@@ -36,6 +36,55 @@ class TestThresholdAnalyzer:
         assert "statistical_parity" in analyzer.fairness_metrics
         assert "accuracy" in analyzer.performance_metrics
 
+    def test_default_thresholds_float32(self) -> None:
+        """Test that float32 scores are compared in float32."""
+        analyzer = ThresholdAnalyzer(performance_metrics=["recall"])
+
+        results = analyzer.analyze(
+            np.array([1, 0]),
+            np.array([0.47, 0.1], dtype=np.float32),
+            pd.Series(["A", "B"]),
+        )
+
+        recall = results.set_index(results["threshold"].round(2))["recall"]
+        assert recall[0.47] == 1.0
+        assert recall[0.48] == 0.0
+        assert analyzer._sorted_cache[0].dtype == np.float32
+
+    def test_float64_scores_compared_in_float64(self) -> None:
+        """Test that float64 scores just below a threshold stay below it."""
+        analyzer = ThresholdAnalyzer(performance_metrics=["recall"])
+
+        results = analyzer.analyze(
+            np.array([1, 0]),
+            np.array([0.7799999831761204, 0.1]),
+            pd.Series(["A", "B"]),
+        )
+
+        recall = results.set_index(results["threshold"].round(2))["recall"]
+        assert recall[0.77] == 1.0
+        assert recall[0.78] == 0.0
+        assert analyzer._sorted_cache[0].dtype == np.float64
+
+    def test_default_thresholds_reported_in_float64(self) -> None:
+        """Test that results show the float64 grid, not float32 values."""
+        analyzer = ThresholdAnalyzer(
+            fairness_metrics=["statistical_parity"], performance_metrics=["recall"]
+        )
+
+        results = analyzer.analyze(
+            np.array([1, 0, 1, 0]),
+            np.array([0.9, 0.2, 0.6, 0.4]),
+            pd.Series(["A", "A", "B", "B"]),
+        )
+
+        assert results["threshold"].dtype == np.float64
+        assert results["threshold"].iloc[0] == 0.01
+        optimal = analyzer.find_optimal_threshold(
+            fairness_metric="statistical_parity_diff", performance_metric="recall"
+        )
+        assert optimal["threshold"] == round(optimal["threshold"], 2)
+
     def test_initialization_custom(self) -> None:
         """Test custom initialization."""
         custom_thresholds = np.array([0.3, 0.5, 0.7])
@@ -65,6 +114,66 @@ class TestThresholdAnalyzer:
         assert "accuracy" in results.columns
         assert "statistical_parity_diff" in results.columns
 
+    def test_performance_metrics_match_sklearn(self, sample_data: dict) -> None:
+        """Test vectorized performance metrics against sklearn per threshold."""
+        from sklearn.metrics import (
+            accuracy_score,
+            f1_score,
+            precision_score,
+            recall_score,
+        )
+
+        y_true = sample_data["y_true"]
+        y_proba = sample_data["y_pred_proba"]
+        analyzer = ThresholdAnalyzer()
+
+        results = analyzer.analyze(y_true, y_proba, sample_data["sensitive"])
+
+        for row in results.itertuples():
+            y_pred = (y_proba >= row.threshold).astype(int)
+            assert row.accuracy == pytest.approx(accuracy_score(y_true, y_pred))
+            assert row.precision == pytest.approx(
+                precision_score(y_true, y_pred, zero_division=0.0)
+            )
+            assert row.recall == pytest.approx(
+                recall_score(y_true, y_pred, zero_division=0.0)
+            )
+            assert row.f1_score == pytest.approx(
+                f1_score(y_true, y_pred, zero_division=0.0)
+            )
+
+    def test_fairness_metrics_match_posttrain(self) -> None:
+        """Test vectorized fairness metrics against the per-threshold metrics."""
+        from justiceai.core.metrics.posttrain import (
+            disparate_impact,
+            equal_opportunity,
+            equalized_odds,
+            statistical_parity,
+        )
+
+        rng = np.random.default_rng(0)
+        y_true = rng.integers(0, 2, 300)
+        y_proba = rng.random(300)
+        sensitive = pd.Series(rng.choice(["A", "B", "C"], 300))
+        analyzer = ThresholdAnalyzer(thresholds=np.linspace(0.1, 0.9, 9))
+
+        results = analyzer.analyze(y_true, y_proba, sensitive)
+
+        for row in results.itertuples():
+            y_pred = (y_proba >= row.threshold).astype(int)
+            sp = statistical_parity(y_pred, sensitive)
+            eq = equalized_odds(y_true, y_pred, sensitive)
+            assert row.statistical_parity_diff == pytest.approx(sp["difference"])
+            assert row.statistical_parity_ratio == pytest.approx(sp["ratio"])
+            assert row.disparate_impact_ratio == pytest.approx(
+                disparate_impact(y_pred, sensitive)["ratio"]
+            )
+            assert row.equal_opportunity_diff == pytest.approx(
+                equal_opportunity(y_true, y_pred, sensitive)["difference"]
+            )
+            assert row.equalized_odds_tpr_diff == pytest.approx(eq["tpr_difference"])
+            assert row.equalized_odds_fpr_diff == pytest.approx(eq["fpr_difference"])
+
     def test_analyze_stores_results(self, sample_data: dict) -> None:
         """Test that analyze stores results internally."""
         analyzer = ThresholdAnalyzer(thresholds=np.array([0.5]))
@@ -78,6 +187,24 @@ class TestThresholdAnalyzer:
         assert analyzer.results_ is not None
         assert isinstance(analyzer.results_, pd.DataFrame)
 
+    def test_reanalyze_reuses_sorted_inputs(self, sample_data: dict) -> None:
+        """Test re-analysis of the same inputs with new thresholds."""
+        args = (
+            sample_data["y_true"],
+            sample_data["y_pred_proba"],
+            sample_data["sensitive"],
+        )
+        analyzer = ThresholdAnalyzer()
+        analyzer.analyze(*args)
+        sorted_inputs = analyzer._sorted_cache
+
+        analyzer.thresholds = np.linspace(0.2, 0.8, 7, dtype=np.float32)
+        results = analyzer.analyze(*args)
+
+        assert analyzer._sorted_cache is sorted_inputs
+        expected = ThresholdAnalyzer(thresholds=analyzer.thresholds).analyze(*args)
+        pd.testing.assert_frame_equal(results, expected)
+
     def test_find_optimal_threshold(self, sample_data: dict) -> None:
         """Test finding optimal threshold."""
         analyzer = ThresholdAnalyzer(thresholds=np.linspace(0.1, 0.9, 9))
@@ -125,6 +252,22 @@ class TestThresholdAnalyzer:
         # Should either find a threshold or return None with message
         assert "threshold" in optimal
 
+    def test_find_optimal_unsatisfiable_constraint(self, sample_data: dict) -> None:
+        """Test that an unsatisfiable constraint returns before scoring."""
+        analyzer = ThresholdAnalyzer(thresholds=np.linspace(0.1, 0.9, 9))
+
+        analyzer.analyze(
+            y_true=sample_data["y_true"],
+            y_pred_proba=sample_data["y_pred_proba"],
+            sensitive_attr=sample_data["sensitive"],
+        )
+
+        optimal = analyzer.find_optimal_threshold(fairness_constraint=2.0)
+
+        assert optimal["threshold"] is None
+        assert optimal["fairness_constraint"] == 2.0
+        assert analyzer._norm_cache == {}
+
     def test_different_fairness_weights(self, sample_data: dict) -> None:
         """Test that different weights produce different results."""
         analyzer = ThresholdAnalyzer(thresholds=np.linspace(0.1, 0.9, 9))
@@ -142,6 +285,24 @@ class TestThresholdAnalyzer:
         assert "threshold" in result_fairness
         assert "threshold" in result_performance
 
+    def test_normalization_cached_until_reanalyzed(self, sample_data: dict) -> None:
+        """Test that normalized metrics are reused until analyze() runs again."""
+        analyzer = ThresholdAnalyzer(thresholds=np.linspace(0.1, 0.9, 9))
+        args = (
+            sample_data["y_true"],
+            sample_data["y_pred_proba"],
+            sample_data["sensitive"],
+        )
+        analyzer.analyze(*args)
+
+        analyzer.find_optimal_threshold(fairness_weight=0.9)
+        cached = analyzer._norm_cache[("disparate_impact_ratio", "f1_score")]
+        analyzer.find_optimal_threshold(fairness_weight=0.1)
+        assert analyzer._norm_cache[("disparate_impact_ratio", "f1_score")] is cached
+
+        analyzer.analyze(*args)
+        assert analyzer._norm_cache == {}
+
     def test_plot_tradeoff_curve(self, sample_data: dict) -> None:
         """Test getting plot data."""
         analyzer = ThresholdAnalyzer(thresholds=np.array([0.3, 0.5, 0.7]))
@@ -63,6 +63,42 @@ class TestFairnessCalculator:
 
         assert calculator._validated
 
+    def test_validate_inputs_returns_categorical(self, sample_data: dict) -> None:
+        """Test the sensitive attribute is converted to categorical."""
+        calculator = FairnessCalculator()
+        sensitive = sample_data["sensitive"]
+
+        converted = calculator._validate_inputs(sensitive_attr=sensitive)
+
+        assert isinstance(converted.dtype, pd.CategoricalDtype)
+        assert converted.tolist() == sensitive.tolist()
+        assert calculator._validate_inputs(sensitive_attr=converted) is converted
+
+    def test_validate_inputs_sees_mutated_sensitive_attr(self) -> None:
+        """Test that a Series changed in place is converted again."""
+        calculator = FairnessCalculator()
+        sensitive = pd.Series(list("AABB"))
+
+        calculator._validate_inputs(sensitive_attr=sensitive)
+        sensitive[:] = list("ABAB")
+        converted = calculator._validate_inputs(sensitive_attr=sensitive)
+
+        assert converted.tolist() == ["A", "B", "A", "B"]
+
+    def test_cached_results_follow_mutated_sensitive_attr(self) -> None:
+        """Test the result cache is not hit after an in-place change."""
+        calculator = FairnessCalculator(cache_results=True)
+        y_true = np.array([1, 0, 1, 0])
+        y_pred = np.array([1, 1, 0, 0])
+        sensitive = pd.Series(list("AABB"))
+
+        first = calculator.calculate_posttrain_metrics(y_true, y_pred, sensitive)
+        sensitive[:] = list("ABAB")
+        second = calculator.calculate_posttrain_metrics(y_true, y_pred, sensitive)
+
+        assert first["statistical_parity"]["difference"] == pytest.approx(1.0)
+        assert second["statistical_parity"]["difference"] == pytest.approx(0.0)
+
     def test_validate_inputs_length_mismatch_y(self) -> None:
         """Test validation fails with mismatched lengths."""
         calculator = FairnessCalculator()
@@ -166,6 +202,76 @@ class TestFairnessCalculator:
         assert results1 is results2
         assert "posttrain" in calculator.cache
 
+    def test_posttrain_cache_keyed_by_content(self, sample_data: dict) -> None:
+        """Test that different data is recomputed and equal data is reused."""
+        calculator = FairnessCalculator(cache_results=True)
+
+        results1 = calculator.calculate_posttrain_metrics(
+            y_true=sample_data["y"],
+            y_pred=sample_data["y_pred"],
+            sensitive_attr=sample_data["sensitive"],
+        )
+        results2 = calculator.calculate_posttrain_metrics(
+            y_true=sample_data["y"],
+            y_pred=1 - sample_data["y_pred"],
+            sensitive_attr=sample_data["sensitive"],
+        )
+        results3 = calculator.calculate_posttrain_metrics(
+            y_true=sample_data["y"].copy(),
+            y_pred=sample_data["y_pred"].copy(),
+            sensitive_attr=sample_data["sensitive"].copy(),
+        )
+
+        assert results2 is not results1
+        assert results2["confusion_matrix"] != results1["confusion_matrix"]
+        assert results3 is results1
+        assert calculator.cache["posttrain"] is results1
+
+    def test_result_cache_is_bounded(self, sample_data: dict) -> None:
+        """Test that the least recently used results are evicted."""
+        from justiceai.core.metrics.calculator import _RESULT_CACHE_SIZE
+
+        calculator = FairnessCalculator(cache_results=True)
+        y_true, sensitive = sample_data["y"], sample_data["sensitive"]
+
+        first = calculator.calculate_posttrain_metrics(
+            y_true, sample_data["y_pred"], sensitive
+        )
+        for shift in range(1, _RESULT_CACHE_SIZE + 1):
+            calculator.calculate_posttrain_metrics(
+                y_true, np.roll(sample_data["y_pred"], shift), sensitive
+            )
+
+        assert len(calculator._results) == _RESULT_CACHE_SIZE
+        assert set(calculator.cache) == {"posttrain"}
+        assert (
+            calculator.calculate_posttrain_metrics(
+                y_true, sample_data["y_pred"], sensitive
+            )
+            is not first
+        )
+
+    def test_no_fingerprint_without_cache(
+        self, sample_data: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that inputs are not hashed when caching is disabled."""
+        from justiceai.core.metrics import calculator as calculator_module
+
+        def fail(*inputs):
+            raise AssertionError("inputs hashed with caching disabled")
+
+        monkeypatch.setattr(calculator_module, "_fingerprint", fail)
+        calculator = FairnessCalculator(cache_results=False)
+
+        calculator.calculate_all(
+            y_true=sample_data["y"],
+            y_pred=sample_data["y_pred"],
+            sensitive_attr=sample_data["sensitive"],
+            X=sample_data["X"],
+        )
+
+        assert len(calculator.cache) == 0
+
     def test_calculate_all_with_X(self, sample_data: dict) -> None:
         """Test calculating all metrics with features."""
         calculator = FairnessCalculator()
@@ -198,6 +304,47 @@ class TestFairnessCalculator:
         assert "posttrain" in results
         assert "summary" in results
 
+    def test_calculate_all_factorizes_once(
+        self, sample_data: dict, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pre and post-training metrics share one factorization."""
+        from justiceai.core.metrics import calculator as calculator_module
+
+        calls = []
+        original = calculator_module.factorize_groups
+
+        def counting(sensitive_attr: pd.Series):
+            calls.append(sensitive_attr)
+            return original(sensitive_attr)
+
+        monkeypatch.setattr(calculator_module, "factorize_groups", counting)
+        calculator = FairnessCalculator(cache_results=False)
+
+        calculator.calculate_all(
+            y_true=sample_data["y"],
+            y_pred=sample_data["y_pred"],
+            sensitive_attr=sample_data["sensitive"],
+            X=sample_data["X"],
+        )
+
+        assert len(calls) == 1
+
+    def test_mutated_sensitive_attr_is_refactorized(self) -> None:
+        """Test that in-place changes to the sensitive attribute are seen."""
+        calculator = FairnessCalculator(cache_results=False)
+        y_true = np.array([1, 1, 0, 0, 1, 0, 1, 0])
+        y_pred = np.array([1, 0, 1, 0, 1, 0, 1, 0])
+        sensitive = pd.Series(list("AAAABBBB"), dtype="category")
+
+        calculator.calculate_posttrain_metrics(y_true, y_pred, sensitive)
+        sensitive[:] = list("ABABABAB")
+        results = calculator.calculate_posttrain_metrics(y_true, y_pred, sensitive)
+
+        assert results["statistical_parity"]["difference"] == pytest.approx(1.0)
+        by_group = results["statistical_parity"]["by_group"]
+        assert by_group["A"]["selection_rate"] == 1.0
+        assert by_group["B"]["selection_rate"] == 0.0
+
     def test_calculate_summary_structure(self, sample_data: dict) -> None:
         """Test summary statistics structure."""
         calculator = FairnessCalculator()
@@ -258,6 +405,39 @@ class TestFairnessCalculator:
         assert summary["n_violations"] > 0
         assert not summary["passes_basic_fairness"]
 
+    def test_violation_mask_drives_recommendations(self) -> None:
+        """Test the summary bitmask matches the violations and recommendations."""
+        calculator = FairnessCalculator()
+        results = calculator.calculate_all(
+            y_true=np.array([1, 1, 1, 1]),
+            y_pred=np.array([1, 1, 0, 0]),
+            sensitive_attr=pd.Series(["A", "A", "B", "B"]),
+        )
+
+        summary = results["summary"]
+        assert bin(summary["violation_mask"]).count("1") == summary["n_violations"]
+        assert calculator.get_recommendations(results) == (
+            calculator.get_recommendations({"posttrain": results["posttrain"]})
+        )
+
+    def test_recommendations_follow_edited_results(self, sample_data: dict) -> None:
+        """Test recommendations reflect changes made to a results dict."""
+        calculator = FairnessCalculator()
+
+        results = calculator.calculate_all(
+            y_true=sample_data["y"],
+            y_pred=sample_data["y_pred"],
+            sensitive_attr=sample_data["sensitive"],
+        )
+        calculator.get_recommendations(results)
+
+        results["posttrain"]["disparate_impact"].update(
+            ratio=0.5, passes_80_rule=False
+        )
+        recommendations = calculator.get_recommendations(results)
+
+        assert any("ratio (0.50)" in rec for rec in recommendations)
+
     def test_get_recommendations_with_results(self, sample_data: dict) -> None:
         """Test getting recommendations with provided results."""
         calculator = FairnessCalculator()
@@ -390,3 +570,58 @@ class TestFairnessCalculator:
 
         # Should be different objects (not cached)
         assert results1 is not results2
+
+    def test_calculate_all_batch_matches_calculate_all(self, sample_data: dict) -> None:
+        """Test batched results equal one calculate_all call per model."""
+        rng = np.random.default_rng(0)
+        y_preds = rng.integers(0, 2, (3, len(sample_data["y"])))
+        y_pred_probas = rng.random(y_preds.shape)
+
+        batch = FairnessCalculator().calculate_all_batch(
+            y_true=sample_data["y"],
+            y_preds=y_preds,
+            sensitive_attr=sample_data["sensitive"],
+            X=sample_data["X"],
+            y_pred_probas=y_pred_probas,
+        )
+
+        assert len(batch) == 3
+        for y_pred, y_pred_proba, results in zip(
+            y_preds, y_pred_probas, batch, strict=True
+        ):
+            expected = FairnessCalculator(cache_results=False).calculate_all(
+                y_true=sample_data["y"],
+                y_pred=y_pred,
+                sensitive_attr=sample_data["sensitive"],
+                X=sample_data["X"],
+                y_pred_proba=y_pred_proba,
+            )
+            assert results["posttrain"] == expected["posttrain"]
+            assert results["summary"] == expected["summary"]
+
+    def test_calculate_all_batch_requires_2d_predictions(
+        self, sample_data: dict
+    ) -> None:
+        """Test batched predictions must be a (n_models, n_samples) matrix."""
+        calculator = FairnessCalculator()
+
+        with pytest.raises(ValueError, match="n_models, n_samples"):
+            calculator.calculate_all_batch(
+                y_true=sample_data["y"],
+                y_preds=sample_data["y_pred"],
+                sensitive_attr=sample_data["sensitive"],
+            )
+
+    def test_compact_labels(self) -> None:
+        """Test binary labels shrink to uint8 and other values are kept."""
+        from justiceai.core.metrics.calculator import _compact_labels
+
+        ints = _compact_labels(np.array([0, 1, 1, 0]))
+        bools = _compact_labels(np.array([True, False, True])[::-1])
+        scores = np.array([0.2, 0.9])
+
+        assert ints.dtype == np.uint8 and ints.tolist() == [0, 1, 1, 0]
+        assert bools.dtype == np.uint8 and bools.flags.c_contiguous
+        assert bools.tolist() == [1, 0, 1]
+        assert _compact_labels(scores) is scores
+        assert _compact_labels(np.array([0, 2])).dtype == np.int64
@@ -0,0 +1,31 @@
+"""Tests for post-training metric numeric kernels."""
+
+import numpy as np
+
+from justiceai.core.metrics._kernels import group_confusion_counts
+
+
+class TestGroupConfusionCounts:
+    """Tests for the per-group confusion count kernel."""
+
+    def test_counts_per_group(self):
+        """Test TN/FP/FN/TP columns per group, skipping non-binary values."""
+        y_true = np.array([1, 0, 1, 0, 1, 2])
+        y_pred = np.array([1, 1, 0, 0, 1, 1])
+        codes = np.array([0, 0, 1, 1, 1, 0])
+
+        counts = group_confusion_counts(y_true, y_pred, codes, 2)
+
+        assert counts.tolist() == [[0, 1, 0, 1], [1, 0, 1, 1]]
+
+    def test_binary_fast_path(self):
+        """Test the packed path for bool/int inputs matches the masked path."""
+        rng = np.random.default_rng(1)
+        y_true = rng.integers(0, 2, 500)
+        y_pred = rng.random(500) < 0.3
+        codes = rng.integers(0, 3, 500)
+
+        np.testing.assert_array_equal(
+            group_confusion_counts(y_true, y_pred, codes, 3),
+            group_confusion_counts(y_true.astype(float), y_pred, codes, 3),
+        )
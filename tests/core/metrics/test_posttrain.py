@@ -230,6 +230,17 @@ class TestConfusionMatrixByGroup:
             == 3
         )
 
+    def test_groups_in_order_of_appearance(self) -> None:
+        """Test that groups are keyed by first appearance, including NaN."""
+        y_true = np.array([1, 0, 1, 0, 1])
+        y_pred = np.array([1, 1, 0, 0, 1])
+        sensitive = pd.Series(["B", np.nan, "A", "B", np.nan])
+
+        result = confusion_matrix_by_group(y_true, y_pred, sensitive)
+
+        assert list(result) == ["B", "nan", "A"]
+        assert result["nan"] == {"TP": 1, "TN": 0, "FP": 1, "FN": 0, "total": 2}
+
 
 class TestAdvancedMetrics:
     """Tests for advanced post-training metrics."""
@@ -325,3 +336,86 @@ class TestAdvancedMetrics:
         assert "B" in result["by_group"]
         assert "expected_calibration_error" in result["by_group"]["A"]
         assert result["by_group"]["A"]["expected_calibration_error"] >= 0
+
+    def test_precomputed_confusion_matches(self) -> None:
+        """Test that metrics from shared counts match direct computation."""
+        from justiceai.core.metrics import posttrain
+
+        rng = np.random.default_rng(0)
+        y_true = rng.integers(0, 2, 200)
+        y_pred = rng.integers(0, 2, 200)
+        sensitive = pd.Series(rng.choice(["A", "B", "C"], 200))
+        confusion = posttrain._compute_group_confusion(y_true, y_pred, sensitive)
+
+        for name in ["statistical_parity", "disparate_impact"]:
+            metric = getattr(posttrain, name)
+            assert metric(y_pred, sensitive, confusion=confusion) == metric(
+                y_pred, sensitive
+            )
+        for name in [
+            "equal_opportunity",
+            "equalized_odds",
+            "confusion_matrix_by_group",
+            "false_negative_rate_difference",
+            "predictive_parity",
+            "negative_predictive_parity",
+            "accuracy_difference",
+            "treatment_equality",
+        ]:
+            metric = getattr(posttrain, name)
+            expected = metric(y_true, y_pred, sensitive)
+            assert metric(None, None, None, confusion=confusion) == expected
+
+    def test_assemble_posttrain_matches_metric_functions(self) -> None:
+        """Test the fused assembly equals the individual metric results."""
+        from justiceai.core.metrics import posttrain
+
+        rng = np.random.default_rng(1)
+        y_true = rng.integers(0, 2, 300)
+        y_pred = rng.integers(0, 2, 300)
+        sensitive = pd.Series(rng.choice(["A", "B", "C", "D"], 300))
+        confusion = posttrain._compute_group_confusion(y_true, y_pred, sensitive)
+
+        assembled = posttrain._assemble_posttrain(confusion)
+
+        assert assembled == {
+            "statistical_parity": posttrain.statistical_parity(y_pred, sensitive),
+            "disparate_impact": posttrain.disparate_impact(y_pred, sensitive),
+            "equal_opportunity": posttrain.equal_opportunity(y_true, y_pred, sensitive),
+            "equalized_odds": posttrain.equalized_odds(y_true, y_pred, sensitive),
+            "confusion_matrix": posttrain.confusion_matrix_by_group(
+                y_true, y_pred, sensitive
+            ),
+            "false_negative_rate_diff": posttrain.false_negative_rate_difference(
+                y_true, y_pred, sensitive
+            ),
+            "predictive_parity": posttrain.predictive_parity(y_true, y_pred, sensitive),
+            "negative_predictive_parity": posttrain.negative_predictive_parity(
+                y_true, y_pred, sensitive
+            ),
+            "accuracy_difference": posttrain.accuracy_difference(
+                y_true, y_pred, sensitive
+            ),
+            "treatment_equality": posttrain.treatment_equality(
+                y_true, y_pred, sensitive
+            ),
+        }
+
+    def test_calibration_error_per_group(self) -> None:
+        """Test ECE is the mean gap over each group's non-empty bins."""
+        from justiceai.core.metrics.posttrain import calibration_by_group
+
+        y_true = np.array([1, 0, 0, 1, 1, 1])
+        y_proba = np.array([0.9, 0.7, 0.1, 0.5, 0.5, 0.95])
+        sensitive = pd.Series(["A", "A", "A", "B", "B", "B"])
+
+        result = calibration_by_group(y_true, y_proba, sensitive, n_bins=2)
+
+        # A: bin [0, .5) -> |0 - .1|; bin [.5, 1] -> |0.5 - 0.8|
+        assert result["by_group"]["A"]["expected_calibration_error"] == (
+            pytest.approx((0.1 + 0.3) / 2)
+        )
+        # B: only the upper bin is filled -> |1 - 0.65|
+        assert result["by_group"]["B"]["expected_calibration_error"] == (
+            pytest.approx(0.35)
+        )
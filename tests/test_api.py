@@ -353,3 +353,33 @@ class TestAuditAPI:
         assert isinstance(report, FairnessReport)
         # Verify browser was called
         mock_browser.assert_called_once()
+
+    @patch("webbrowser.open")
+    def test_audit_with_show_and_path_saves_once(
+        self, mock_browser: any, trained_model: RandomForestClassifier, sample_data: tuple
+    ) -> None:
+        """Test audit() writes the HTML only once when showing a saved report."""
+        X, y, gender = sample_data
+
+        with patch.object(FairnessReport, "save_html", autospec=True) as mock_save:
+            audit(
+                model=trained_model,
+                X=X,
+                y_true=y,
+                sensitive_attrs=gender,
+                output_path="report.html",
+                show=True,
+            )
+
+        mock_save.assert_called_once()
+        mock_browser.assert_called_once()
+
+    def test_audit_reuses_evaluator_per_threshold(self) -> None:
+        """Test that evaluators are shared between calls with the same threshold."""
+        from justiceai.api import _get_evaluator
+
+        evaluator = _get_evaluator(0.05)
+
+        assert _get_evaluator(0.05) is evaluator
+        assert _get_evaluator(0.1) is not evaluator
+        assert _get_evaluator(0.1).fairness_threshold == 0.1
@@ -14,3 +14,25 @@ def test_module_has_license() -> None:
     import justiceai
 
     assert justiceai.__license__ == "MIT"
+
+
+def test_public_api_lazy_import() -> None:
+    """Test that public API objects resolve through lazy imports."""
+    import justiceai
+    from justiceai.api import audit
+    from justiceai.fairness_evaluator import FairnessEvaluator
+    from justiceai.reports import FairnessReport
+
+    assert justiceai.audit is audit
+    assert justiceai.FairnessEvaluator is FairnessEvaluator
+    assert justiceai.FairnessReport is FairnessReport
+    assert set(justiceai.__all__) <= set(dir(justiceai))
+
+
+def test_optional_adapters_lazy_import() -> None:
+    """Test that optional adapters resolve through lazy imports."""
+    from justiceai.core import adapters
+    from justiceai.core.adapters.xgboost_adapter import XGBoostAdapter
+
+    assert adapters.XGBoostAdapter is XGBoostAdapter
+    assert set(adapters.__all__) <= set(dir(adapters))